@@ -1,57 +1,48 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import qrcode
-from PIL import Image
-import io
-import base64
 
-# -----------------------------
-# Load Parameters from Excel
-# -----------------------------
-data = pd.read_excel("ewaste_parameters.xlsx", index_col=0)
+from assets import qr_base64
+from charts import bar_chart, line_chart, tornado_chart
+from ewaste_core import (AMBIENT_T, BIO_ORGANISMS, CRITERIA, DEFAULT_PRICES, ENERGY_PRICE,
+                         bio_cost_per_gram, cost_sensitivity, evaluate_methods, ewaste_generation,
+                         generation_bands, generation_draws, link_bio_recoveries,
+                         link_operating_energy, load_feedstock, load_lifetimes, load_parameters,
+                         load_sales, mcda_ranking, metal_price_crossovers, monte_carlo,
+                         national_flows, operating_energy, pareto_front, price_breakevens,
+                         price_sweep, revenue_and_margin, smaa, stream_tonnage, tariff_price,
+                         throughput_crossovers, tornado, varied_parameters)
 
 # -----------------------------
-# Evaluation Function
+# Load Parameters from Excel
 # -----------------------------
-def evaluate_method(name, energy, chemicals_cost, capex, recovery):
-    energy_cost = energy * 0.1   # assume $0.1 per kWh
-    total_cost = chemicals_cost + capex + energy_cost
-
-    return {
-        "Method": name,
-        "Energy (kWh/t)": energy,
-        "Chemicals ($/t)": chemicals_cost,
-        "Capex ($/t)": capex,
-        "Energy cost ($/t)": energy_cost,
-        "Total cost ($/t)": total_cost,
-        "Au recovery": recovery["Au"],
-        "Pd recovery": recovery["Pd"],
-        "Cu recovery": recovery["Cu"],
-    }
+data = load_parameters()
 
 # -----------------------------
 # Process All Methods
 # -----------------------------
-results = []
-
-for method in data.index:
-    recovery = {
-        "Au": data.loc[method, "Au_recovery"],
-        "Pd": data.loc[method, "Pd_recovery"],
-        "Cu": data.loc[method, "Cu_recovery"]
-    }
-    results.append(
-        evaluate_method(
-            method,
-            data.loc[method, "Energy_kWh_per_t"],
-            data.loc[method, "Chemicals_cost_per_t"],
-            data.loc[method, "Capex_per_t"],
-            recovery
-        )
-    )
+energy_price = st.sidebar.number_input(
+    "Electricity price ($/kWh)", min_value=0.0, value=ENERGY_PRICE, step=0.01, format="%.3f"
+)
+
+st.sidebar.header("Bioleaching Conditions")
+bio_pH = st.sidebar.slider("pH", 0.5, 4.0, 2.0, 0.1)
+bio_T = st.sidebar.slider("Temperature (°C)", 15, 50, 30, 1)
+bio_O = st.sidebar.slider("Dissolved O₂ (mg/L)", 0.0, 10.0, 3.0, 0.1)
+workbook = data
+if st.sidebar.checkbox("Take Bio_* recoveries from the bioleaching model"):
+    data = link_bio_recoveries(data, bio_pH, bio_T, bio_O)
+    st.sidebar.caption(", ".join(f"{m} ← {org}" for m, org in BIO_ORGANISMS.items()))
+    bio_energy = float(operating_energy(bio_T, bio_O))
+    if np.isfinite(bio_energy):
+        data = link_operating_energy(data, bio_T, bio_O)
+        st.sidebar.caption(f"Tank heating from {AMBIENT_T:.0f} °C and aeration add "
+                           f"{bio_energy:,.0f} kWh/t to these rows.")
+    else:
+        st.sidebar.warning("This DO setpoint is above air saturation at this temperature, so "
+                           "aeration energy is not added.")
 
-results_df = pd.DataFrame(results).set_index("Method")
+results_df = evaluate_methods(data, energy_price)
 
 # -----------------------------
 # Streamlit UI
@@ -61,12 +52,7 @@ st.markdown("Compare energy use, cost breakdown, and metal yield for Au, Pd, Cu
 
 # --- QR code for References & Data fixed at top right corner, no download button ---
 pdf_url = "https://github.com/yahyam978/EWASTE/raw/main/references_and_data.pdf"
-qr_img = qrcode.make(pdf_url)
-buf = io.BytesIO()
-qr_img.save(buf, format="PNG")
-buf.seek(0)
-import base64
-qr_b64 = base64.b64encode(buf.getvalue()).decode("utf-8")
+qr_b64 = qr_base64(pdf_url)
 
 st.markdown(
     f"""
@@ -109,9 +95,15 @@ st.markdown(
 
 st.header("📊 Simulation Outputs")
 
+# Pareto front over cost, energy and Au/Pd/Cu recovery
+pareto = pareto_front(results_df)
+table_df = results_df.assign(**{"Pareto optimal": pareto})
+if st.checkbox("Show only Pareto-optimal methods (not beaten on cost, energy and every recovery)"):
+    table_df = table_df[pareto]
+
 # Apply styling for table
 styled_df = (
-    results_df
+    table_df
     .style
     .background_gradient(subset=["Total cost ($/t)"], cmap="Blues")
     .background_gradient(subset=["Energy (kWh/t)"], cmap="Oranges")
@@ -133,23 +125,246 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     st.markdown("⚡ **Energy Consumption**")
-    fig1, ax1 = plt.subplots()
-    results_df["Energy (kWh/t)"].plot(kind="bar", ax=ax1, color="orange")
-    ax1.set_ylabel("kWh per ton")
-    st.pyplot(fig1)
+    st.image(bar_chart(results_df["Energy (kWh/t)"], color="orange", ylabel="kWh per ton"),
+             width="stretch")
 
 with col2:
     st.markdown("💰 **Total Cost**")
-    fig2, ax2 = plt.subplots()
-    results_df["Total cost ($/t)"].plot(kind="bar", ax=ax2, color="blue")
-    ax2.set_ylabel("Cost ($/t)")
-    st.pyplot(fig2)
+    st.image(bar_chart(results_df["Total cost ($/t)"], color="blue", ylabel="Cost ($/t)"),
+             width="stretch")
 
 with col3:
     st.markdown("🔎 **Metal Recovery**")
-    fig3, ax3 = plt.subplots()
-    results_df[["Au recovery", "Pd recovery", "Cu recovery"]].plot(kind="bar", ax=ax3)
-    ax3.set_ylabel("Recovery efficiency")
-    st.pyplot(fig3)
+    st.image(bar_chart(results_df[["Au recovery", "Pd recovery", "Cu recovery"]],
+                       ylabel="Recovery efficiency"),
+             width="stretch")
+
+# -----------------------------
+# Multi-Criteria Ranking
+# -----------------------------
+st.subheader("🏆 Multi-Criteria Ranking")
+st.markdown("Relative importance of each criterion (weights are normalized to sum to 1).")
+
+wcols = st.columns(len(CRITERIA))
+criteria_weights = {c: col.slider(c, 0, 10, 5, key=f"weight_{c}") for col, c in zip(wcols, CRITERIA)}
+if sum(criteria_weights.values()) > 0:
+    ranking_df = mcda_ranking(results_df, criteria_weights)
+    st.dataframe(ranking_df.sort_values("TOPSIS rank").style.format(
+        {"Weighted sum score": "{:.3f}", "TOPSIS score": "{:.3f}"}))
+else:
+    st.warning("Give at least one criterion a non-zero weight.")
+
+with st.expander("Stochastic weights (SMAA): how robust is the ranking?"):
+    smaa_method = st.radio("Scoring", ["TOPSIS", "Weighted sum"], horizontal=True)
+    st.markdown("Probability of each rank over 100,000 weight vectors drawn uniformly at random.")
+    smaa_df = smaa(results_df, n=100_000, method=smaa_method, seed=0)
+    st.dataframe(smaa_df.style.format("{:.1%}").background_gradient(cmap="Greens", axis=None))
+
+# -----------------------------
+# Revenue & Margin
+# -----------------------------
+st.subheader("💵 Revenue & Margin by Feedstock")
+st.markdown("Metal content per e-waste stream (g/t) from `feedstock.csv`, valued at the prices below.")
+
+feedstock = load_feedstock()
+pcol1, pcol2, pcol3 = st.columns(3)
+prices = {
+    "Au": pcol1.number_input("Au price ($/g)", min_value=0.0, value=DEFAULT_PRICES["Au"], step=1.0),
+    "Pd": pcol2.number_input("Pd price ($/g)", min_value=0.0, value=DEFAULT_PRICES["Pd"], step=1.0),
+    "Cu": pcol3.number_input("Cu price ($/g)", min_value=0.0, value=DEFAULT_PRICES["Cu"],
+                             step=0.001, format="%.4f"),
+}
+
+revenue_df, margin_df = revenue_and_margin(feedstock, results_df, prices)
+st.markdown("**Margin ($/t) = recovered metal value − total cost**")
+st.dataframe(margin_df.style.format("{:,.0f}").background_gradient(cmap="RdYlGn", axis=None))
+
+# -----------------------------
+# Electricity Price Sweep
+# -----------------------------
+st.subheader("⚡ Electricity Price Sweep")
+
+price_range = st.slider("Price range ($/kWh)", 0.0, 1.0, (0.0, 0.3), 0.01)
+sweep_df = price_sweep(data, np.linspace(*price_range, 61))
+st.image(line_chart(sweep_df, ylabel="Total cost ($/t)", xlabel="Electricity price ($/kWh)",
+                    vline=energy_price),
+         width="stretch")
+
+breakeven_df = price_breakevens(data, *price_range)
+if breakeven_df.empty:
+    st.markdown("No ranking changes in this price range.")
+else:
+    st.markdown("**Break-even prices where two methods swap cost ranking**")
+    st.dataframe(breakeven_df.style.format({"Energy price ($/kWh)": "{:.3f}",
+                                            "Total cost ($/t)": "{:,.0f}"}),
+                 hide_index=True)
+
+with st.expander("Time-of-use tariff"):
+    st.markdown("Period rates and the share of plant energy drawn in each period.")
+    periods = ["Off-peak", "Shoulder", "Peak"]
+    default_rates, default_shares = [0.06, 0.10, 0.18], [40, 35, 25]
+    tou_cols = st.columns(3)
+    rates = [c.number_input(f"{p} rate ($/kWh)", min_value=0.0, value=r, step=0.01, format="%.3f")
+             for c, p, r in zip(tou_cols, periods, default_rates)]
+    shares = [c.number_input(f"{p} share (%)", min_value=0, max_value=100, value=w, step=5)
+              for c, p, w in zip(tou_cols, periods, default_shares)]
+    if sum(shares) > 0:
+        tou_price = float(tariff_price(rates, shares))
+        tou_costs = price_sweep(data, [tou_price]).iloc[0].sort_values()
+        st.markdown(f"Effective price: **${tou_price:.3f}/kWh**")
+        st.dataframe(tou_costs.rename("Total cost ($/t)").to_frame().style.format("{:,.0f}"))
+
+# -----------------------------
+# Bio Methods vs Operating Conditions
+# -----------------------------
+st.subheader("🦠 Bio Methods: Cost per Recovered Gram")
+st.markdown("Bioleaching recoveries from the live model, swept over one condition "
+            "with the other two held at the sidebar values. Costs include tank heating and aeration.")
+
+bcol1, bcol2, bcol3 = st.columns(3)
+bio_stream = bcol1.selectbox("Feedstock stream", list(feedstock.index), key="bio_stream")
+bio_metal = bcol2.selectbox("Metal", list(prices), key="bio_metal")
+bio_axis = bcol3.selectbox("Sweep", ["Temperature (°C)", "pH", "Dissolved O₂ (mg/L)"])
+
+sweeps = {
+    "pH": np.linspace(0.5, 4.0, 71),
+    "Temperature (°C)": np.linspace(15, 50, 71),
+    "Dissolved O₂ (mg/L)": np.linspace(0.0, 10.0, 101),
+}
+bio_conditions = {"pH": bio_pH, "Temperature (°C)": bio_T, "Dissolved O₂ (mg/L)": bio_O}
+bio_conditions[bio_axis] = sweeps[bio_axis]
+bio_methods, per_gram = bio_cost_per_gram(
+    workbook, feedstock.loc[bio_stream], *bio_conditions.values(), metals=[bio_metal],
+    energy_price=energy_price,
+    extra_energy=operating_energy(bio_conditions["Temperature (°C)"],
+                                  bio_conditions["Dissolved O₂ (mg/L)"]),
+)
+if bio_methods:
+    per_gram_df = pd.DataFrame(per_gram.T, index=pd.Index(sweeps[bio_axis], name=bio_axis),
+                               columns=bio_methods)
+    st.image(line_chart(per_gram_df.replace(np.inf, np.nan), ylabel=f"$ per g {bio_metal}",
+                        xlabel=bio_axis),
+             width="stretch")
+    st.caption("The whole method cost is charged to the selected metal.")
+
+# -----------------------------
+# Pairwise Crossover Points
+# -----------------------------
+st.subheader("🔀 Crossover Points Between Methods")
+
+xcol1, xcol2, xcol3 = st.columns(3)
+# Electricity price break-evens are listed under the price sweep above
+cross_variable = xcol1.selectbox("Crossover variable", ["Throughput", "Metal price"])
+if cross_variable == "Throughput":
+    cross_df = throughput_crossovers(results_df, energy_price)
+    cross_fmt, cross_unit = "{:.2f}", "multiples of the workbook plant size"
+    cross_note = ("Capex per ton scales as 1 / throughput; above the crossing the method "
+                  "with the higher capex is cheaper.")
+else:
+    cross_stream = xcol2.selectbox("Feedstock stream", list(feedstock.index))
+    cross_metal = xcol3.selectbox("Metal", list(prices))
+    cross_df = metal_price_crossovers(results_df, feedstock.loc[cross_stream], cross_metal, prices)
+    cross_fmt, cross_unit = "{:,.3f}", f"{cross_metal} $/g"
+    cross_note = f"Above it the method recovering more {cross_metal} has the higher margin."
+
+st.dataframe(cross_df.style.format(cross_fmt, na_rep="—").background_gradient(cmap="Purples",
+                                                                             axis=None))
+st.caption(f"Value at which the row and column methods break even, in {cross_unit}. "
+           f"{cross_note} A dash marks pairs that never cross.")
+
+# -----------------------------
+# Monte Carlo Uncertainty
+# -----------------------------
+st.subheader("🎲 Uncertainty Bands (Monte Carlo)")
+st.markdown(
+    "Add `<column>_low` / `<column>_high` (and optionally `<column>_dist`: "
+    "triangular, uniform or normal) columns to the Excel sheet to give a parameter a distribution."
+)
+varied = varied_parameters(data)
+if varied:
+    st.caption("Varied: " + ", ".join(f"`{c}`" for c in varied))
+else:
+    st.info("The workbook has no `_low` / `_high` columns yet, so nothing is varied and "
+            "P5, P50 and P95 all equal the point values.")
+
+if st.checkbox("Run Monte Carlo simulation"):
+    n_samples = st.select_slider(
+        "Samples per method", options=[10_000, 100_000, 1_000_000], value=100_000
+    )
+    mc_df = monte_carlo(data, n_samples=n_samples, seed=0, energy_price=energy_price)
+    st.dataframe(mc_df.style.format("{:.3f}"), height=300)
+
+# -----------------------------
+# Global Sensitivity (Sobol)
+# -----------------------------
+st.subheader("🧮 Global Sensitivity (Sobol Indices)")
+st.markdown("Share of total-cost variance explained by each input when all inputs vary together.")
+
+scol1, scol2 = st.columns(2)
+sens_method = scol1.selectbox("Method", list(data.index), key="sobol_method")
+sens_spread = scol2.slider("Input range (± %)", 5, 50, 20, 5)
+
+sobol_df = cost_sensitivity(data.loc[sens_method], spread=sens_spread / 100, seed=0,
+                            energy_price=energy_price)
+st.image(bar_chart(sobol_df, ylabel="Sobol index", figsize=(6.4, 3.2)), width="stretch")
+
+# -----------------------------
+# One-at-a-Time Sensitivity (Tornado)
+# -----------------------------
+st.subheader("🌪️ Tornado: One-at-a-Time Sensitivity")
+
+tcol1, tcol2 = st.columns(2)
+tornado_method = tcol1.selectbox("Method", list(data.index), key="tornado_method")
+tornado_pct = tcol2.slider("Perturbation (± %)", 1, 50, 10, 1)
+
+tornado_df = tornado(data, pct=tornado_pct / 100, energy_price=energy_price)
+method_swings = tornado_df.loc[tornado_method]
+method_swings = method_swings[method_swings["Swing ($/t)"] > 0]
+st.image(
+    tornado_chart(method_swings, results_df.loc[tornado_method, "Total cost ($/t)"],
+                  xlabel="Total cost ($/t)", title=f"{tornado_method}: ±{tornado_pct}% per input"),
+    width="stretch",
+)
+st.caption("Recovery columns do not enter the cost model and are left out of the chart.")
+
+# -----------------------------
+# National E-waste Flows (Egypt)
+# -----------------------------
+st.subheader("🇪🇬 National E-waste Generation (Egypt)")
+st.markdown(
+    "Products put on the market (`egypt_sales.csv`) become e-waste after Weibull-distributed "
+    "lifetimes (`product_lifetimes.csv`). Both files hold indicative values; replace them with "
+    "national statistics."
+)
+
+sales = load_sales()
+lifetimes = load_lifetimes()
+generation = ewaste_generation(sales, lifetimes)
+
+ncol1, ncol2 = st.columns(2)
+n_draws = ncol1.select_slider("Monte Carlo draws", options=[100, 1_000, 10_000], value=1_000)
+first_year, last_year = int(sales.index.min()), int(sales.index.max())
+flow_year = ncol2.slider("Year", first_year, last_year, min(max(2025, first_year), last_year))
+
+bands = generation_bands(generation_draws(sales, lifetimes, n_draws, seed=0), sales.index)
+gcol1, gcol2 = st.columns(2)
+with gcol1:
+    st.markdown("**Generation by product (t/yr)**")
+    st.image(line_chart(generation, ylabel="t/yr", xlabel="Year", vline=flow_year),
+             width="stretch")
+with gcol2:
+    st.markdown("**Total generation with uncertainty band (t/yr)**")
+    st.image(line_chart(bands, ylabel="t/yr", xlabel="Year", vline=flow_year),
+             width="stretch")
+
+tonnage = stream_tonnage(generation, lifetimes)
+flows = national_flows(tonnage, feedstock, results_df, prices)
+year_df = pd.DataFrame({name: df.loc[flow_year] for name, df in flows.items()})
+year_df[["Total cost ($)", "Margin ($)"]] /= 1e6
+year_df = year_df.rename(columns={"Total cost ($)": "Total cost ($M)", "Margin ($)": "Margin ($M)"})
+st.markdown(f"**If all {flow_year} feedstock-stream tonnage went through each method** "
+            f"({tonnage.loc[flow_year].sum():,.0f} t of the {generation.loc[flow_year].sum():,.0f} t "
+            "generated; the rest of each product is outside the per-ton models)")
+st.dataframe(year_df.style.format("{:,.1f}"))
 
 st.success("✅ Simulation completed. Adjust Excel values for sensitivity analysis.")
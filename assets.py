@@ -0,0 +1,23 @@
+import base64
+import io
+from functools import lru_cache
+
+import qrcode
+
+# -----------------------------
+# Static Image Assets
+# -----------------------------
+# The QR codes only depend on their URL, so they are rendered once per
+# process and shared by every rerun and session.
+@lru_cache(maxsize=None)
+def qr_png(url):
+    """PNG bytes of a QR code for url."""
+    buf = io.BytesIO()
+    qrcode.make(url).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=None)
+def qr_base64(url):
+    """Base64 string of qr_png(url), ready for a data: URI."""
+    return base64.b64encode(qr_png(url)).decode("utf-8")
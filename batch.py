@@ -0,0 +1,161 @@
+"""Headless batch evaluation of scenario files.
+
+Streams a CSV or Parquet file in chunks, evaluates each chunk with the
+cost or bioleaching model and appends the results to the output file, so
+memory use does not depend on the input size.
+
+    python batch.py cost methods.parquet costs.parquet
+    python batch.py recovery conditions.csv recoveries.csv --chunksize 500000
+
+cost rows hold the ewaste_parameters.xlsx columns (the first column, or
+"Method", names the row). recovery rows hold organism, metal, pH,
+temperature and oxygen columns.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+import pandas as pd
+
+from ewaste_core import PARAM_COLUMNS, evaluate_methods, recovery_points
+
+RECOVERY_COLUMNS = ["organism", "metal", "pH", "temperature", "oxygen"]
+
+
+# -----------------------------
+# Chunk Evaluators
+# -----------------------------
+def evaluate_cost_chunk(chunk):
+    if "Method" in chunk.columns:
+        chunk = chunk.set_index("Method")
+    elif chunk.columns[0] not in PARAM_COLUMNS:
+        chunk = chunk.set_index(chunk.columns[0])
+    _require(chunk, PARAM_COLUMNS)
+    return evaluate_methods(chunk).reset_index()
+
+
+def evaluate_recovery_chunk(chunk):
+    _require(chunk, RECOVERY_COLUMNS)
+    out = chunk.copy()
+    # Conditions are floats in every chunk, whatever the CSV reader inferred
+    for c in RECOVERY_COLUMNS[2:]:
+        out[c] = out[c].astype(float)
+    out["recovery"] = recovery_points(*(out[c].to_numpy() for c in RECOVERY_COLUMNS))
+    return out
+
+
+EVALUATORS = {"cost": evaluate_cost_chunk, "recovery": evaluate_recovery_chunk}
+
+
+def _require(chunk, columns):
+    missing = [c for c in columns if c not in chunk.columns]
+    if missing:
+        raise ValueError(f"Input is missing column(s): {missing}")
+
+
+# -----------------------------
+# Streaming I/O
+# -----------------------------
+def _format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".parquet", ".pq"):
+        return "parquet"
+    if ext in (".csv", ".txt"):
+        return "csv"
+    raise ValueError(f"Unsupported file type: {path}")
+
+
+def read_chunks(path, chunksize):
+    if _format(path) == "csv":
+        yield from pd.read_csv(path, chunksize=chunksize)
+    else:
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+
+
+class ChunkWriter:
+    """Appends DataFrame chunks to a CSV or Parquet file.
+
+    Chunks go to a temporary file next to path, which replaces path only
+    when the writer exits without an error; a failed run leaves path as it
+    was.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.format = _format(path)
+        self._tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        self._writer = None
+        self._first = True
+
+    def write(self, df):
+        if self.format == "csv":
+            df.to_csv(self._tmp, mode="w" if self._first else "a",
+                      header=self._first, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self._tmp, table.schema)
+            else:
+                # Pass-through columns may be inferred as int in one chunk
+                # and float in the next; the first chunk fixes the schema
+                table = table.cast(self._writer.schema)
+            self._writer.write_table(table)
+        self._first = False
+
+    def close(self, commit=True):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if commit and not self._first:
+            os.replace(self._tmp, self.path)
+        elif os.path.exists(self._tmp):
+            os.remove(self._tmp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        self.close(commit=exc_type is None)
+
+
+def run(mode, src, dst, chunksize=100_000, log=None):
+    """Evaluate src chunk by chunk into dst; returns the number of rows."""
+    evaluate = EVALUATORS[mode]
+    rows = 0
+    start = time.perf_counter()
+    with ChunkWriter(dst) as writer:
+        for chunk in read_chunks(src, chunksize):
+            writer.write(evaluate(chunk))
+            rows += len(chunk)
+            if log:
+                log(f"{rows:,} rows ({time.perf_counter() - start:.1f} s)")
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("mode", choices=sorted(EVALUATORS))
+    parser.add_argument("input", help="CSV or Parquet scenario file")
+    parser.add_argument("output", help="CSV or Parquet results file")
+    parser.add_argument("--chunksize", type=int, default=100_000,
+                        help="rows evaluated per chunk (default: 100000)")
+    parser.add_argument("--quiet", action="store_true", help="no progress output")
+    args = parser.parse_args(argv)
+
+    log = None if args.quiet else (lambda msg: print(msg, file=sys.stderr))
+    try:
+        run(args.mode, args.input, args.output, args.chunksize, log)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"error: {exc}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""Benchmarks for the cost and recovery hot paths.
+
+    python bench.py                 # run everything, append to bench_history.json
+    python bench.py --quick         # fewer repeats, smallest catalogs only
+    python bench.py --no-save       # print results without recording them
+
+Every run is appended to the JSON history together with the git commit and
+library versions, and compared against the previous entry.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+import charts
+from ewaste_core import (METALS, PARAM_COLUMNS, PARAMS_FILE, default_catalog, evaluate_methods,
+                         generation_draws, load_lifetimes, load_parameters, load_sales,
+                         pareto_front, recovery_fraction, recovery_grid, recovery_points)
+
+HISTORY_FILE = "bench_history.json"
+CATALOG_SIZES = (10, 1_000, 100_000)
+# Bar charts with one bar per method stop being meaningful well before 10^5
+MAX_CHART_METHODS = 1_000
+HEATMAP_SIZE = 200
+
+
+# -----------------------------
+# Timing Helpers
+# -----------------------------
+def timeit(fn, repeat=5, min_time=0.05, setup=None):
+    """Best and median seconds per call; calls are batched up to min_time."""
+    if setup:
+        setup()
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - t0) / number)
+    return {"best_s": min(samples), "median_s": statistics.median(samples), "calls": number}
+
+
+def synthetic_catalog(n, seed=0):
+    """n method rows resampled from the workbook with +/-20% noise."""
+    base = load_parameters(PARAMS_FILE)[PARAM_COLUMNS]
+    rng = np.random.default_rng(seed)
+    rows = base.iloc[rng.integers(0, len(base), n)].to_numpy(dtype=float)
+    rows *= rng.uniform(0.8, 1.2, rows.shape)
+    rows[:, 3:] = np.clip(rows[:, 3:], 0.0, 1.0)
+    index = pd.Index([f"method_{i}" for i in range(n)], name="Method")
+    return pd.DataFrame(rows, index=index, columns=PARAM_COLUMNS)
+
+
+# -----------------------------
+# Benchmarks
+# -----------------------------
+def bench_parameter_loading(results, repeat):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, os.path.basename(PARAMS_FILE))
+        shutil.copy(PARAMS_FILE, path)
+        cache = os.path.join(tmp, ".param_cache")
+
+        results["load_params/cold"] = timeit(
+            lambda: load_parameters(path), repeat, min_time=0,
+            setup=lambda: shutil.rmtree(cache, ignore_errors=True),
+        )
+        load_parameters(path)
+        results["load_params/warm"] = timeit(lambda: load_parameters(path), repeat)
+        results["load_params/read_excel"] = timeit(
+            lambda: pd.read_excel(path, index_col=0), repeat, min_time=0
+        )
+
+
+def bench_recovery(results, repeat, sizes):
+    names = default_catalog().names
+    org = names[0]
+    results["recovery/scalar_point"] = timeit(
+        lambda: recovery_fraction(org, 2.0, 30.0, 3.0, "Cu"), repeat
+    )
+
+    rng = np.random.default_rng(0)
+    for n in sizes:
+        orgs = rng.choice(names, n)
+        metals = rng.choice(METALS, n)
+        pH, T, O = rng.uniform(0.5, 4.0, n), rng.uniform(15, 50, n), rng.uniform(0, 10, n)
+        results[f"recovery/points/{n}"] = timeit(
+            lambda: recovery_points(orgs, metals, pH, T, O), repeat
+        )
+
+    pH = np.linspace(0.5, 4.0, 36)[:, None, None]
+    T = np.linspace(15, 50, 36)[None, :, None]
+    O = np.linspace(0, 10, 101)[None, None, :]
+    results["recovery/grid/slider_domain"] = timeit(
+        lambda: recovery_grid(names, METALS, pH, T, O), repeat
+    )
+
+
+def bench_cost_table(results, repeat, sizes):
+    for n in sizes:
+        catalog = synthetic_catalog(n)
+        results[f"cost/evaluate_methods/{n}"] = timeit(lambda: evaluate_methods(catalog), repeat)
+        table = evaluate_methods(catalog)
+        results[f"cost/pareto_front/{n}"] = timeit(lambda: pareto_front(table), repeat)
+
+
+def bench_material_flows(results, repeat, sizes):
+    sales, lifetimes = load_sales(), load_lifetimes()
+    for n in sizes:
+        results[f"mfa/generation_draws/{n}"] = timeit(
+            lambda: generation_draws(sales, lifetimes, n, seed=0), repeat
+        )
+
+
+def bench_charts(results, repeat, sizes):
+    for n in sizes:
+        if n > MAX_CHART_METHODS:
+            continue
+        totals = evaluate_methods(synthetic_catalog(n))["Total cost ($/t)"]
+        # Cold renders of large charts take seconds; two samples are enough
+        results[f"chart/bar/cold/{n}"] = timeit(
+            lambda: charts.bar_chart(totals, color="blue", ylabel="Cost ($/t)"),
+            min(repeat, 2), min_time=0, setup=charts.clear_cache,
+        )
+        results[f"chart/bar/warm/{n}"] = timeit(
+            lambda: charts.bar_chart(totals, color="blue", ylabel="Cost ($/t)"), repeat
+        )
+
+    # Heatmap redraw as in the bioleaching app: grid evaluation plus render
+    org = default_catalog().names[0]
+    pH, T = np.linspace(0.5, 4.0, HEATMAP_SIZE), np.linspace(15, 50, HEATMAP_SIZE)
+
+    def heatmap():
+        values = recovery_grid([org], ["Cu"], pH[:, None], T[None, :], 3.0)[0, 0]
+        return charts.heatmap(pd.DataFrame(values, index=pH, columns=T), vmin=0, vmax=1)
+
+    heatmap()
+    results[f"chart/heatmap/redraw/{HEATMAP_SIZE}"] = timeit(
+        heatmap, repeat, min_time=0, setup=charts.clear_cache
+    )
+
+
+# -----------------------------
+# History
+# -----------------------------
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def report(results, previous=None):
+    prev = previous["results"] if previous else {}
+    width = max(len(name) for name in results)
+    for name, r in results.items():
+        line = f"{name:<{width}}  {r['best_s'] * 1e3:12.4f} ms"
+        if name in prev:
+            line += f"  ({r['best_s'] / prev[name]['best_s']:.2f}x prev)"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="3 repeats, 10-method catalog only")
+    parser.add_argument("--history", default=HISTORY_FILE, help="JSON history file")
+    parser.add_argument("--no-save", action="store_true", help="do not append to the history")
+    args = parser.parse_args(argv)
+
+    repeat = 3 if args.quick else 5
+    sizes = CATALOG_SIZES[:1] if args.quick else CATALOG_SIZES
+
+    results = {}
+    bench_parameter_loading(results, repeat)
+    bench_recovery(results, repeat, sizes)
+    bench_cost_table(results, repeat, sizes)
+    bench_material_flows(results, repeat, sizes)
+    bench_charts(results, repeat, sizes)
+
+    history = load_history(args.history)
+    report(results, history[-1] if history else None)
+
+    if not args.no_save:
+        history.append({
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "quick": args.quick,
+            "results": results,
+        })
+        with open(args.history, "w") as f:
+            json.dump(history, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,77 +1,37 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 from math import exp
-from io import BytesIO
-import qrcode
-from PIL import Image
+import time
+
+from assets import qr_png
+from charts import annotated_bar_chart, bar_chart, heatmap, line_chart
+from ewaste_core import (AMBIENT_T, ENERGY_PRICE, RecoveryTable, aeration_energy, bio_cost_per_kg,
+                         days_to_target, default_catalog, economic_optimum, heating_energy,
+                         load_feedstock, load_parameters, optimum_conditions, recovery_grid,
+                         recovery_sensitivity, simulate_leaching)
 
 st.set_page_config(layout="wide", page_title="Bioleaching Recovery Simulator")
 
 # ---------- Load data ----------
-@st.cache_data
-def load_params():
-    # make sure ewaste_parameters.xlsx is in same folder
-    df = pd.read_excel("ewaste_parameters.xlsx")
-    return df
+# make sure ewaste_parameters.xlsx is in same folder; load_parameters
+# re-reads it whenever the file changes, so edits show up on rerun
+params_df = load_parameters().reset_index()
 
-params_df = load_params()
+# Built once per metal and server process and shared by every session;
+# float32 keeps a table near 0.5 MB per organism
+@st.cache_resource
+def load_recovery_table(metal):
+    return RecoveryTable(metals=[metal], dtype=np.float32)
 
 # ---------- QR Code for references PDF ----------
 PDF_URL = "https://raw.githubusercontent.com/yahyam978/EWASTE/main/references_and_data.pdf"
-qr = qrcode.make(PDF_URL)
-buf = BytesIO()
-qr.save(buf, format="PNG")
-qr_img = Image.open(buf)
-
-st.sidebar.image(qr_img, caption="📄 References & Data", width=150)
+st.sidebar.image(qr_png(PDF_URL), caption="📄 References & Data", width=150)
 
 # ---------- Page title ----------
 st.title("Bioleaching Metal Recovery Simulator")
 st.markdown("Explore how pH, temperature, and oxygen affect predicted metal recovery for different bacteria.")
 
-# ---------- Organism parameters ----------
-organisms = {
-    "Acidithiobacillus ferrooxidans": {
-        "pH_opt": 2.0, "pH_sigma": 0.7,
-        "T_opt": 30.0, "T_sigma": 6.0,
-        "K_O": 0.5,
-        "recovery_max": {"Cu": 0.90, "Au": 0.55, "Pd": 0.40}
-    },
-    "Leptospirillum spp.": {
-        "pH_opt": 1.5, "pH_sigma": 0.6,
-        "T_opt": 40.0, "T_sigma": 6.0,
-        "K_O": 0.6,
-        "recovery_max": {"Cu": 0.85, "Au": 0.45, "Pd": 0.32}
-    },
-    "Acidithiobacillus thiooxidans": {
-        "pH_opt": 1.8, "pH_sigma": 0.6,
-        "T_opt": 28.0, "T_sigma": 6.0,
-        "K_O": 0.6,
-        "recovery_max": {"Cu": 0.88, "Au": 0.38, "Pd": 0.30}
-    }
-}
-
-# ---------- Helper functions ----------
-def gauss_factor(x, x_opt, sigma):
-    return float(np.exp(-0.5 * ((x - x_opt) / sigma)**2))
-
-def monod_factor(O, K):
-    return float(O / (K + O)) if O >= 0 else 0.0
-
-def recovery_fraction(org, pH, T, O, metal):
-    p = organisms[org]
-    f_pH = gauss_factor(pH, p["pH_opt"], p["pH_sigma"])
-    f_T = gauss_factor(T, p["T_opt"], p["T_sigma"])
-    f_O = monod_factor(O, p["K_O"])
-    # Improved combination: more realistic nonlinear synergy
-    synergy = (0.5 * f_pH + 0.3 * f_T + 0.2 * f_O)
-    synergy = min(1.0, synergy ** 1.2)  # emphasize near-optimal values
-    base = p["recovery_max"].get(metal, 0.0)
-    combined = base * synergy
-    return max(0.0, min(1.0, combined))
-
 # ---------- Sidebar inputs ----------
 st.sidebar.header("Operating Conditions")
 pH = st.sidebar.slider("pH", 0.5, 4.0, 2.0, 0.1)
@@ -85,58 +45,170 @@ st.markdown(f"### Conditions: pH = **{pH:.2f}**, Temperature = **{temperature} 
 st.markdown(f"Predicted {metal_choice} recovery by species:")
 
 # ---------- Calculate recoveries ----------
-records = []
-for org in organisms.keys():
-    rec = recovery_fraction(org, pH, temperature, oxygen, metal_choice)
-    records.append({"Bacteria": org, "Recovery (%)": rec * 100})
-
-df_out = pd.DataFrame(records).set_index("Bacteria")
+recovery_table = load_recovery_table(metal_choice)
+recs = recovery_table.lookup(pH, temperature, oxygen)[:, 0]
+df_out = pd.DataFrame({"Bacteria": recovery_table.orgs, "Recovery (%)": recs * 100}).set_index("Bacteria")
 
 # ---------- Plot ----------
-fig, ax = plt.subplots(figsize=(8, 4))
 vals = df_out["Recovery (%)"]
-bars = ax.bar(vals.index, vals.values, color=["#1f77b4", "#ff7f0e", "#2ca02c"])
-ax.set_ylim(0, 100)
-ax.set_ylabel("Recovery (%)")
-ax.set_title(f"{metal_choice} Recovery by Bacteria")
-
-for bar in bars:
-    h = bar.get_height()
-    ax.annotate(f"{h:.1f}%", xy=(bar.get_x()+bar.get_width()/2, h),
-                xytext=(0, 3), textcoords="offset points",
-                ha="center", va="bottom")
-
-plt.xticks(rotation=15, ha="right")
-st.pyplot(fig)
+st.image(
+    annotated_bar_chart(vals, colors=["#1f77b4", "#ff7f0e", "#2ca02c"], ylabel="Recovery (%)",
+                        title=f"{metal_choice} Recovery by Bacteria", ylim=(0, 100)),
+    width="stretch",
+)
 
 # ---------- Numeric table ----------
 st.subheader("Numeric Results")
 st.table(df_out.style.format("{:.2f}"))
 
+# ---------- pH x temperature map ----------
+st.markdown("---")
+st.subheader("🗺️ Recovery Map: pH × Temperature")
+st.markdown(f"Predicted {metal_choice} recovery over the full slider ranges at DO = {oxygen:.2f} mg/L. "
+            "The circle marks the current sidebar conditions.")
+
+mcol1, mcol2 = st.columns(2)
+map_org = mcol1.selectbox("Bacteria", default_catalog().names, key="map_org")
+map_size = mcol2.select_slider("Grid resolution", options=[50, 100, 200], value=200)
+
+map_start = time.perf_counter()
+map_pH = np.linspace(0.5, 4.0, map_size)
+map_T = np.linspace(15, 50, map_size)
+map_values = recovery_grid([map_org], [metal_choice], map_pH[:, None], map_T[None, :], oxygen)[0, 0]
+st.image(
+    heatmap(pd.DataFrame(map_values * 100, index=map_pH, columns=map_T),
+            xlabel="Temperature (°C)", ylabel="pH", cbar_label=f"{metal_choice} recovery (%)",
+            title=f"{map_org}: {metal_choice} recovery at DO {oxygen:.1f} mg/L",
+            marker=(temperature, pH), vmin=0, vmax=100),
+    width="stretch",
+)
+st.caption(f"{map_size}×{map_size} grid evaluated and drawn in "
+           f"{(time.perf_counter() - map_start) * 1e3:.0f} ms.")
+
+# ---------- Batch kinetics ----------
+st.markdown("---")
+st.subheader("⏱ Batch Leaching Kinetics")
+st.markdown(
+    f"Recovery over time in a batch reactor at the conditions above. "
+    f"Biomass grows logistically and leaching slows as {metal_choice} approaches the steady-state recovery."
+)
+
+kcol1, kcol2 = st.columns(2)
+days = kcol1.slider("Batch length (days)", 5, 120, 45, 5)
+target = kcol2.slider(f"Target {metal_choice} recovery (%)", 5, 95, 50, 5)
+
+@st.cache_data
+def leaching_curves(pH, temperature, oxygen, metal, days):
+    t, R = simulate_leaching(default_catalog().names, metal, pH, temperature, oxygen, days=days)
+    return pd.DataFrame(R.T * 100, index=pd.Index(t, name="Day"), columns=default_catalog().names)
+
+curves = leaching_curves(pH, temperature, oxygen, metal_choice, days)
+st.image(
+    line_chart(curves, ylabel=f"{metal_choice} recovery (%)", xlabel="Day",
+               title=f"{metal_choice} Recovery vs Time", hline=target),
+    width="stretch",
+)
+
+to_target = days_to_target(curves.index.to_numpy(), curves.to_numpy().T, target)
+st.table(pd.DataFrame(
+    {"Days to target": [f"{d:.1f}" if np.isfinite(d) else f"not reached in {days} d" for d in to_target]},
+    index=pd.Index(curves.columns, name="Bacteria"),
+))
+
+# ---------- Global sensitivity ----------
+st.markdown("---")
+st.subheader("🧮 Global Sensitivity (Sobol Indices)")
+st.markdown(
+    f"Share of the variance in predicted {metal_choice} recovery explained by each input. "
+    "Operating conditions span the full slider ranges; organism parameters vary around their catalog values."
+)
+
+gcol1, gcol2 = st.columns(2)
+sens_org = gcol1.selectbox("Bacteria", default_catalog().names, key="sens_org")
+sens_spread = gcol2.slider("Organism parameter range (± %)", 5, 50, 20, 5)
+
+@st.cache_data
+def sobol_table(org, metal, spread):
+    return recovery_sensitivity(org, metal, spread=spread / 100, seed=0)
+
+st.image(bar_chart(sobol_table(sens_org, metal_choice, sens_spread), ylabel="Sobol index",
+                   figsize=(8, 3.2)),
+         width="stretch")
+
 # ---------- Optimum conditions summary ----------
 st.markdown("---")
 st.subheader("📊 Optimum Conditions Summary (from model)")
 
-opt_data = []
-for org, p in organisms.items():
-    for metal, max_r in p["recovery_max"].items():
-        opt_data.append({
-            "Bacteria": org,
-            "Metal": metal,
-            "Optimum pH": p["pH_opt"],
-            "Optimum Temp (°C)": p["T_opt"],
-            "O₂ Half-sat (K_O)": p["K_O"],
-            "Max Recovery (%)": max_r * 100
-        })
+st.markdown("Optimum operating conditions found by searching `recovery_fraction` within the window below.")
 
-opt_df = pd.DataFrame(opt_data)
+bcol1, bcol2, bcol3 = st.columns(3)
+pH_bounds = bcol1.slider("pH window", 0.5, 4.0, (0.5, 4.0), 0.1)
+T_bounds = bcol2.slider("Temperature window (°C)", 15, 50, (15, 50), 1)
+O_bounds = bcol3.slider("Dissolved O₂ window (mg/L)", 0.0, 10.0, (0.0, 10.0), 0.1)
+
+@st.cache_data
+def find_optimum(pH_bounds, T_bounds, O_bounds):
+    return optimum_conditions(pH_bounds=pH_bounds, T_bounds=T_bounds, O_bounds=O_bounds)
+
+opt_df = find_optimum(pH_bounds, T_bounds, O_bounds)
+catalog = default_catalog()
+opt_df.insert(5, "O₂ Half-sat (K_O)", catalog.K_O[catalog.org_indices(opt_df["Bacteria"])])
 
 # Format numeric columns to 2 decimal places as strings for display in st.dataframe()
 show_df = opt_df.copy()
-for col in ["Optimum pH", "Optimum Temp (°C)", "O₂ Half-sat (K_O)", "Max Recovery (%)"]:
+for col in ["Optimum pH", "Optimum Temp (°C)", "Optimum DO (mg/L)", "O₂ Half-sat (K_O)", "Max Recovery (%)"]:
     show_df[col] = show_df[col].map("{:.2f}".format)
 
-st.dataframe(show_df, use_container_width=True)
+st.dataframe(show_df, width="stretch")
+
+# ---------- Operating energy and economic optimum ----------
+st.markdown("---")
+st.subheader("⚡ Operating Energy & Economic Optimum")
+st.markdown(
+    "Heating the tank above ambient and aerating it to the DO setpoint cost energy. "
+    "Added to the Bio_* rows of the cost workbook, this gives the cost per kg of recovered metal, "
+    "whose minimum is the economic optimum rather than the biological one."
+)
+
+ecol1, ecol2, ecol3 = st.columns(3)
+ambient = ecol1.slider("Ambient temperature (°C)", 10, 40, int(AMBIENT_T), 1)
+energy_price = ecol2.number_input("Electricity price ($/kWh)", min_value=0.0, value=ENERGY_PRICE,
+                                  step=0.01, format="%.3f")
+feedstock = load_feedstock()
+stream = ecol3.selectbox("Feedstock stream", list(feedstock.index))
+
+heat_kwh = float(heating_energy(temperature, ambient))
+air_kwh = float(aeration_energy(temperature, oxygen))
+air_text = f"{air_kwh:,.0f} kWh/t" if np.isfinite(air_kwh) else "not reachable with air"
+st.markdown(f"At the sidebar conditions: heating **{heat_kwh:,.0f} kWh/t**, aeration **{air_text}**.")
+
+cost_params = params_df.set_index("Method")
+
+# The frames are hashed into the cache key, so workbook edits show up
+@st.cache_data
+def economic_table(params, composition, metal, energy_price, ambient):
+    return economic_optimum(params, composition, metals=[metal],
+                            energy_price=energy_price, ambient=ambient)
+
+st.dataframe(economic_table(cost_params, feedstock.loc[stream], metal_choice, energy_price,
+                            ambient).style.format("{:,.2f}"),
+             width="stretch")
+
+cost_methods, cost_map = bio_cost_per_kg(
+    cost_params, feedstock.loc[stream], map_pH[:, None], map_T[None, :], oxygen,
+    metals=[metal_choice], energy_price=energy_price, ambient=ambient,
+)
+cost_col1, cost_col2 = st.columns(2)
+for col, method, values in zip((cost_col1, cost_col2), cost_methods, cost_map):
+    col.image(
+        heatmap(pd.DataFrame(np.where(np.isfinite(values), values, np.nan), index=map_pH,
+                             columns=map_T),
+                xlabel="Temperature (°C)", ylabel="pH", cbar_label=f"$ per kg {metal_choice}",
+                title=f"{method} at DO {oxygen:.1f} mg/L", marker=(temperature, pH)),
+        width="stretch",
+    )
+st.caption("The whole method cost is charged to the selected metal. Blank areas need a DO "
+           "above air saturation, which aeration cannot reach.")
 
 st.markdown("---")
 st.markdown("🔍 Use the QR code (sidebar) to access the **References & Data PDF** which lists all citations and the dataset.")
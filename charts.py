@@ -0,0 +1,205 @@
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+# -----------------------------
+# Cached PNG Chart Rendering
+# -----------------------------
+# Charts are drawn on standalone Figure objects (never registered with
+# pyplot), rendered to PNG bytes and cleared. The bytes are cached by a
+# hash of the plotted data and styling, so identical views cost nothing
+# and server memory stays flat under sustained traffic.
+CACHE_SIZE = 256
+DPI = 100
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def clear_cache():
+    with _lock:
+        _cache.clear()
+
+
+def _data_key(kind, data, **style):
+    h = hashlib.sha1(kind.encode())
+    h.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    names = data.columns if isinstance(data, pd.DataFrame) else [data.name]
+    h.update(repr((list(names), sorted(style.items()))).encode())
+    return h.hexdigest()
+
+
+def _cached_render(key, draw, figsize):
+    def render():
+        fig = Figure(figsize=figsize, dpi=DPI)
+        try:
+            draw(fig.add_subplot())
+            buf = io.BytesIO()
+            fig.savefig(buf, format="png", bbox_inches="tight")
+            return buf.getvalue()
+        finally:
+            fig.clear()
+
+    return _cached(key, render)
+
+
+def _cached(key, render):
+    with _lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    png = render()
+
+    with _lock:
+        _cache[key] = png
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return png
+
+
+def bar_chart(series, color=None, ylabel=None, figsize=(6.4, 4.8)):
+    """Bar chart of a Series (or one bar group per column of a DataFrame)."""
+    def draw(ax):
+        series.plot(kind="bar", ax=ax, color=color)
+        ax.set_ylabel(ylabel)
+
+    key = _data_key("bar", series, color=color, ylabel=ylabel, figsize=figsize)
+    return _cached_render(key, draw, figsize)
+
+
+def annotated_bar_chart(series, colors, ylabel=None, title=None, ylim=None,
+                        fmt="{:.1f}%", figsize=(8, 4)):
+    """Bar chart with each bar's value written above it."""
+    def draw(ax):
+        bars = ax.bar(series.index, series.values, color=colors)
+        if ylim is not None:
+            ax.set_ylim(*ylim)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        for bar in bars:
+            h = bar.get_height()
+            ax.annotate(fmt.format(h), xy=(bar.get_x() + bar.get_width() / 2, h),
+                        xytext=(0, 3), textcoords="offset points",
+                        ha="center", va="bottom")
+        ax.tick_params(axis="x", labelrotation=15)
+        for label in ax.get_xticklabels():
+            label.set_horizontalalignment("right")
+
+    key = _data_key("annotated_bar", series, colors=tuple(colors), ylabel=ylabel,
+                    title=title, ylim=ylim, fmt=fmt, figsize=figsize)
+    return _cached_render(key, draw, figsize)
+
+
+def line_chart(df, ylabel=None, xlabel=None, title=None, hline=None, vline=None,
+               figsize=(8, 4)):
+    """One line per DataFrame column against the index."""
+    def draw(ax):
+        df.plot(ax=ax)
+        if hline is not None:
+            ax.axhline(hline, color="grey", linestyle="--", linewidth=1)
+        if vline is not None:
+            ax.axvline(vline, color="grey", linestyle="--", linewidth=1)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+
+    key = _data_key("line", df, ylabel=ylabel, xlabel=xlabel, title=title, hline=hline,
+                    vline=vline, figsize=figsize)
+    return _cached_render(key, draw, figsize)
+
+
+def tornado_chart(swings, base, xlabel=None, title=None, figsize=(8, 4)):
+    """Horizontal low/high bars around base, largest swing on top.
+
+    swings: frame indexed by input with "Low ($/t)" and "High ($/t)" columns.
+    """
+    def draw(ax):
+        ordered = swings.assign(_swing=(swings["High ($/t)"] - swings["Low ($/t)"]).abs())
+        ordered = ordered.sort_values("_swing")
+        y = range(len(ordered))
+        ax.barh(y, ordered["Low ($/t)"] - base, left=base, color="#1f77b4", label="Input lowered")
+        ax.barh(y, ordered["High ($/t)"] - base, left=base, color="#ff7f0e", label="Input raised")
+        ax.set_yticks(list(y))
+        ax.set_yticklabels(ordered.index)
+        ax.axvline(base, color="black", linewidth=1)
+        ax.set_xlabel(xlabel)
+        ax.set_title(title)
+        ax.legend(loc="lower right")
+
+    key = _data_key("tornado", swings, base=float(base), xlabel=xlabel, title=title,
+                    figsize=figsize)
+    return _cached_render(key, draw, figsize)
+
+
+# -----------------------------
+# Heatmaps
+# -----------------------------
+# Heatmaps are redrawn on every slider move. Axes, colorbar and labels are
+# built once per layout and kept; a redraw only swaps the raster, marker
+# and title and skips the tight bounding-box pass, which keeps a 200 x 200
+# grid well under 100 ms.
+FRAME_CACHE_SIZE = 16
+
+_frames = OrderedDict()
+_frame_lock = threading.Lock()
+
+
+def _heatmap_frame(extent, xlabel, ylabel, cbar_label, vmin, vmax, figsize):
+    layout = (extent, xlabel, ylabel, cbar_label, vmin, vmax, figsize)
+    if layout in _frames:
+        _frames.move_to_end(layout)
+        return _frames[layout]
+
+    fig = Figure(figsize=figsize, dpi=DPI)
+    fig.subplots_adjust(left=0.1, right=0.98, bottom=0.11, top=0.93)
+    ax = fig.add_subplot()
+    image = ax.imshow([[0.0]], origin="lower", aspect="auto", interpolation="nearest",
+                      extent=extent, cmap="viridis", vmin=vmin, vmax=vmax)
+    fig.colorbar(image, ax=ax, label=cbar_label)
+    (point,) = ax.plot([], [], marker="o", markersize=8, markerfacecolor="none",
+                       markeredgecolor="white", markeredgewidth=2, linestyle="none")
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    _frames[layout] = (fig, ax, image, point)
+    while len(_frames) > FRAME_CACHE_SIZE:
+        _frames.popitem(last=False)
+    return _frames[layout]
+
+
+def heatmap(df, xlabel=None, ylabel=None, title=None, cbar_label=None, marker=None,
+            vmin=None, vmax=None, figsize=(6.4, 4.8)):
+    """Image of a regular grid: rows are the y axis (index), columns the x axis.
+
+    Drawn as a single imshow raster, so cost does not grow with the number
+    of cells. marker is an optional (x, y) point to highlight.
+    """
+    x, y = df.columns.to_numpy(dtype=float), df.index.to_numpy(dtype=float)
+    dx = (x[-1] - x[0]) / max(len(x) - 1, 1) / 2
+    dy = (y[-1] - y[0]) / max(len(y) - 1, 1) / 2
+    extent = (x[0] - dx, x[-1] + dx, y[0] - dy, y[-1] + dy)
+
+    def render():
+        values = df.to_numpy(dtype=float)
+        finite = values[np.isfinite(values)]
+        lo = vmin if vmin is not None else (finite.min() if finite.size else 0.0)
+        hi = vmax if vmax is not None else (finite.max() if finite.size else 1.0)
+        with _frame_lock:
+            fig, ax, image, point = _heatmap_frame(extent, xlabel, ylabel, cbar_label,
+                                                   vmin, vmax, figsize)
+            image.set_data(values)
+            image.set_clim(lo, hi)
+            point.set_data(*([[marker[0]], [marker[1]]] if marker is not None else [[], []]))
+            ax.set_title(title)
+            buf = io.BytesIO()
+            fig.savefig(buf, format="png", pil_kwargs={"compress_level": 1})
+            return buf.getvalue()
+
+    key = _data_key("heatmap", df, xlabel=xlabel, ylabel=ylabel, title=title,
+                    cbar_label=cbar_label, marker=marker, vmin=vmin, vmax=vmax, figsize=figsize)
+    return _cached(key, render)
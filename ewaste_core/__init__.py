@@ -0,0 +1,26 @@
+"""Compute core for the EWASTE apps: cost and bioleaching models and loaders.
+
+Imports only NumPy and pandas, so worker processes and batch jobs can use
+the models without loading Streamlit, matplotlib or the QR code stack.
+The process-pool executor lives in ewaste_core.parallel.
+"""
+from .bioleaching import (METALS, OrganismCatalog, RecoveryTable, default_catalog, gauss_factor,
+                          monod_factor, recovery_fraction, recovery_grid, recovery_points)
+from .biolink import BIO_ORGANISMS, bio_cost_per_gram, link_bio_recoveries
+from .cost_model import (ENERGY_PRICE, PARAM_COLUMNS, RESULT_COLUMNS, cost_components,
+                         evaluate_method, evaluate_methods, price_sweep, tariff_price)
+from .crossover import (crossover_matrix, energy_price_crossovers, metal_price_crossovers,
+                        price_breakevens, throughput_crossovers)
+from .kinetics import days_to_target, simulate_leaching
+from .mcda import CRITERIA, mcda_ranking, smaa
+from .mfa import (ewaste_generation, generation_bands, generation_draws, in_use_stock,
+                  national_flows, stream_tonnage)
+from .montecarlo import monte_carlo, varied_parameters
+from .operating import (AMBIENT_T, aeration_energy, bio_cost_per_kg, economic_optimum,
+                        heating_energy, link_operating_energy, operating_energy)
+from .optimize import optimum_conditions
+from .pareto import PARETO_OBJECTIVES, pareto_front, pareto_mask
+from .params import (FEEDSTOCK_FILE, LIFETIMES_FILE, ORGANISMS_FILE, PARAMS_FILE, SALES_FILE,
+                     load_feedstock, load_lifetimes, load_organisms, load_parameters, load_sales)
+from .revenue import DEFAULT_PRICES, recovered_mass, revenue_and_margin
+from .sensitivity import cost_sensitivity, recovery_sensitivity, sobol_indices, tornado
@@ -0,0 +1,219 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from .params import load_organisms
+
+# ---------- Organism catalog ----------
+class OrganismCatalog:
+    """Organism parameters compiled once into contiguous arrays.
+
+    Entry i of pH_opt, pH_sigma, T_opt, T_sigma and K_O belongs to names[i];
+    recovery_max is an (organisms x metals) matrix ordered like metals.
+    Model code gathers from these arrays by integer index.
+    """
+
+    FIELDS = ("pH_opt", "pH_sigma", "T_opt", "T_sigma", "K_O")
+    RECOVERY_SUFFIX = "_recovery_max"
+
+    def __init__(self, names, metals, pH_opt, pH_sigma, T_opt, T_sigma, K_O, recovery_max):
+        self.names = list(names)
+        self.metals = list(metals)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.metal_index = {metal: j for j, metal in enumerate(self.metals)}
+        self.pH_opt = np.ascontiguousarray(pH_opt, dtype=float)
+        self.pH_sigma = np.ascontiguousarray(pH_sigma, dtype=float)
+        self.T_opt = np.ascontiguousarray(T_opt, dtype=float)
+        self.T_sigma = np.ascontiguousarray(T_sigma, dtype=float)
+        self.K_O = np.ascontiguousarray(K_O, dtype=float)
+        self.recovery_max = np.ascontiguousarray(recovery_max, dtype=float).reshape(
+            len(self.names), len(self.metals)
+        )
+        # Trailing zero column: metal index -1 (not in the catalog) recovers nothing
+        self._base = np.hstack([self.recovery_max, np.zeros((len(self.names), 1))])
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build from a table indexed by organism with FIELDS and <metal>_recovery_max columns."""
+        missing = [f for f in cls.FIELDS if f not in df.columns]
+        if missing:
+            raise ValueError(f"Organism table is missing column(s): {missing}")
+        rec_cols = [c for c in df.columns if c.endswith(cls.RECOVERY_SUFFIX)]
+        metals = [c[: -len(cls.RECOVERY_SUFFIX)] for c in rec_cols]
+        return cls(
+            df.index, metals,
+            *(df[f].to_numpy(dtype=float) for f in cls.FIELDS),
+            df[rec_cols].fillna(0.0).to_numpy(dtype=float),
+        )
+
+    def __len__(self):
+        return len(self.names)
+
+    def org_indices(self, orgs):
+        """Integer rows for organism names (or pass-through integer indices)."""
+        orgs = np.asarray(orgs)
+        if orgs.dtype.kind in "iu":
+            return orgs.astype(np.intp)
+        codes, uniques = pd.factorize(orgs.ravel())
+        unknown = [name for name in uniques if name not in self.index]
+        if unknown:
+            raise ValueError(f"Unknown organism(s): {sorted(unknown)}")
+        rows = np.array([self.index[name] for name in uniques], dtype=np.intp)
+        return rows[codes].reshape(orgs.shape)
+
+    def metal_indices(self, metals):
+        """Integer columns for metal names; -1 for metals not in the catalog."""
+        metals = np.asarray(metals)
+        if metals.dtype.kind in "iu":
+            return metals.astype(np.intp)
+        codes, uniques = pd.factorize(metals.ravel())
+        cols = np.array([self.metal_index.get(m, -1) for m in uniques], dtype=np.intp)
+        return cols[codes].reshape(metals.shape)
+
+    def base(self, org_idx, metal_idx):
+        return self._base[org_idx, metal_idx]
+
+
+@lru_cache(maxsize=None)
+def default_catalog():
+    """Catalog compiled from organisms.csv, once per process."""
+    return OrganismCatalog.from_frame(load_organisms())
+
+
+METALS = ["Cu", "Au", "Pd"]
+
+# ---------- Helper functions ----------
+def gauss_factor(x, x_opt, sigma):
+    return float(np.exp(-0.5 * ((x - x_opt) / sigma)**2))
+
+def monod_factor(O, K):
+    return float(O / (K + O)) if O >= 0 else 0.0
+
+def recovery_fraction(org, pH, T, O, metal, catalog=None):
+    c = default_catalog() if catalog is None else catalog
+    i = c.index[org]
+    f_pH = gauss_factor(pH, float(c.pH_opt[i]), float(c.pH_sigma[i]))
+    f_T = gauss_factor(T, float(c.T_opt[i]), float(c.T_sigma[i]))
+    f_O = monod_factor(O, float(c.K_O[i]))
+    # Improved combination: more realistic nonlinear synergy
+    synergy = (0.5 * f_pH + 0.3 * f_T + 0.2 * f_O)
+    synergy = min(1.0, synergy ** 1.2)  # emphasize near-optimal values
+    base = float(c.base(i, c.metal_index.get(metal, -1)))
+    combined = base * synergy
+    return max(0.0, min(1.0, combined))
+
+# ---------- Vectorized kernels ----------
+# np.float_power goes through libm pow like Python's `**`; np.power uses
+# SIMD loops (and x*x for squares) that can differ by one ulp.
+def gauss_factor_v(x, x_opt, sigma):
+    return np.exp(-0.5 * np.float_power((x - x_opt) / sigma, 2))
+
+def monod_factor_v(O, K):
+    O = np.asarray(O, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(O >= 0, O / (K + O), 0.0)
+
+def recovery_grid(orgs, metals, pH, T, O, catalog=None):
+    """Recovery tensor of shape (len(orgs), len(metals), *broadcast(pH, T, O)).
+
+    orgs and metals are names or catalog indices. pH, T and O broadcast
+    against each other like NumPy arrays, so a full condition grid is
+    obtained by passing e.g. pH[:, None, None], T[None, :, None] and
+    O[None, None, :]. Values match recovery_fraction point for point.
+    """
+    c = default_catalog() if catalog is None else catalog
+    pH, T, O = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (pH, T, O)))
+    cond = (1,) * pH.ndim
+
+    i = c.org_indices(list(orgs))
+    j = c.metal_indices(list(metals))
+    shape = (-1, *cond)
+    base = c.base(i[:, None], j[None, :]).reshape(len(i), len(j), *cond)
+
+    synergy = _synergy_v(pH, T, O, c.pH_opt[i].reshape(shape), c.pH_sigma[i].reshape(shape),
+                         c.T_opt[i].reshape(shape), c.T_sigma[i].reshape(shape),
+                         c.K_O[i].reshape(shape))
+    combined = base * synergy[:, None]
+    return np.clip(combined, 0.0, 1.0)
+
+def recovery_points(orgs, metals, pH, T, O, catalog=None):
+    """Element-wise recovery_fraction over arrays of organisms and metals.
+
+    orgs and metals are names or catalog indices. All five arguments
+    broadcast together; the result has the broadcast shape.
+    """
+    c = default_catalog() if catalog is None else catalog
+    i = c.org_indices(orgs)
+    j = c.metal_indices(metals)
+    i, j, pH, T, O = np.broadcast_arrays(i, j, *(np.asarray(a, dtype=float) for a in (pH, T, O)))
+
+    synergy = _synergy_v(pH, T, O, c.pH_opt[i], c.pH_sigma[i], c.T_opt[i], c.T_sigma[i], c.K_O[i])
+    return np.clip(c.base(i, j) * synergy, 0.0, 1.0)
+
+def _synergy_v(pH, T, O, pH_opt, pH_sigma, T_opt, T_sigma, K_O):
+    f_pH = gauss_factor_v(pH, pH_opt, pH_sigma)
+    f_T = gauss_factor_v(T, T_opt, T_sigma)
+    f_O = monod_factor_v(O, K_O)
+    synergy = (0.5 * f_pH + 0.3 * f_T + 0.2 * f_O)
+    return np.minimum(1.0, np.float_power(synergy, 1.2))
+
+# ---------- Precomputed lookup table ----------
+# Axes cover the biorecovery_app.py slider domains
+PH_AXIS = np.round(np.arange(0.5, 4.0 + 1e-9, 0.1), 10)
+T_AXIS = np.arange(15.0, 50.0 + 1e-9, 1.0)
+O_AXIS = np.round(np.arange(0.0, 10.0 + 1e-9, 0.1), 10)
+
+class RecoveryTable:
+    """Dense recovery table over regular pH x T x DO axes.
+
+    values has shape (organisms, metals, pH, T, DO). lookup() snaps to the
+    nearest grid node in O(1); interpolate() is trilinear and accepts arrays.
+    Points outside the axes are clamped to the edges.
+
+    The default axes take about 1 MB per organism and metal in float64;
+    build one table per metal and pass dtype=np.float32 for large catalogs.
+    """
+
+    def __init__(self, orgs=None, metals=METALS, pH_axis=PH_AXIS, T_axis=T_AXIS, O_axis=O_AXIS,
+                 catalog=None, dtype=float):
+        catalog = default_catalog() if catalog is None else catalog
+        self.orgs = list(catalog.names) if orgs is None else list(orgs)
+        self.metals = list(metals)
+        self.axes = (np.asarray(pH_axis, dtype=float),
+                     np.asarray(T_axis, dtype=float),
+                     np.asarray(O_axis, dtype=float))
+        self.values = recovery_grid(
+            self.orgs, self.metals,
+            self.axes[0][:, None, None], self.axes[1][None, :, None], self.axes[2][None, None, :],
+            catalog=catalog,
+        ).astype(dtype, copy=False)
+        self.values.setflags(write=False)
+
+    def _position(self, axis, x):
+        # Fractional index along a regular axis
+        step = (axis[-1] - axis[0]) / (len(axis) - 1)
+        return np.clip((np.asarray(x, dtype=float) - axis[0]) / step, 0, len(axis) - 1)
+
+    def lookup(self, pH, T, O):
+        i, j, k = (np.rint(self._position(ax, x)).astype(np.intp)
+                   for ax, x in zip(self.axes, (pH, T, O)))
+        return self.values[:, :, i, j, k]
+
+    def interpolate(self, pH, T, O):
+        pos = [self._position(ax, x) for ax, x in zip(self.axes, (pH, T, O))]
+        pos = np.broadcast_arrays(*pos)
+        lo = [np.minimum(np.floor(p).astype(np.intp), len(ax) - 2)
+              for p, ax in zip(pos, self.axes)]
+        w = [p - l for p, l in zip(pos, lo)]
+
+        out = 0.0
+        for di in (0, 1):
+            wi = w[0] if di else 1 - w[0]
+            for dj in (0, 1):
+                wj = w[1] if dj else 1 - w[1]
+                for dk in (0, 1):
+                    wk = w[2] if dk else 1 - w[2]
+                    corner = self.values[:, :, lo[0] + di, lo[1] + dj, lo[2] + dk]
+                    out = out + corner * (wi * wj * wk)
+        return out
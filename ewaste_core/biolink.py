@@ -0,0 +1,62 @@
+import numpy as np
+
+from .bioleaching import recovery_grid
+from .cost_model import ENERGY_PRICE, cost_components
+from .revenue import REVENUE_METALS
+
+# -----------------------------
+# Cost Table <-> Bioleaching Model Link
+# -----------------------------
+# Bio_* rows of the parameter workbook that correspond to an organism in
+# organisms.csv. Rows without a model (e.g. Bio_Fungus) keep their fixed
+# workbook recoveries.
+BIO_ORGANISMS = {
+    "Bio_Acidithiobacillus": "Acidithiobacillus thiooxidans",
+    "Bio_Ferrooxidans": "Acidithiobacillus ferrooxidans",
+}
+
+
+def linked_methods(df, organisms=None):
+    """(method, organism) pairs of the linked Bio_* rows present in df."""
+    organisms = BIO_ORGANISMS if organisms is None else organisms
+    return [(m, org) for m, org in organisms.items() if m in df.index]
+
+
+def link_bio_recoveries(df, pH, T, O, organisms=None, catalog=None):
+    """Copy of a parameter table with linked Bio_* recoveries taken from the
+    bioleaching model at one set of operating conditions."""
+    pairs = linked_methods(df, organisms)
+    out = df.copy()
+    if not pairs:
+        return out
+    methods, orgs = zip(*pairs)
+    rec = recovery_grid(orgs, REVENUE_METALS, pH, T, O, catalog)
+    for k, metal in enumerate(REVENUE_METALS):
+        out.loc[list(methods), f"{metal}_recovery"] = rec[:, k]
+    return out
+
+
+def bio_cost_per_gram(df, composition, pH, T, O, metals=REVENUE_METALS, organisms=None,
+                      energy_price=ENERGY_PRICE, extra_energy=0.0, catalog=None):
+    """Total cost per recovered gram ($/g) of the linked Bio_* methods.
+
+    composition is one feedstock stream (g/t per metal); grams of all
+    metals are added together, so pass metals=["Au"] for $ per gram of
+    gold. pH, T and O broadcast, and every method and condition is
+    evaluated in one recovery_grid call. extra_energy (kWh/t) is added to
+    every method's workbook energy and broadcasts with the conditions.
+    Returns (methods, array) where the array has shape
+    (len(methods), *broadcast shape).
+    """
+    pairs = linked_methods(df, organisms)
+    methods = [m for m, _ in pairs]
+    rows = df.loc[methods]
+    _, total_cost = cost_components(rows["Energy_kWh_per_t"].to_numpy(dtype=float),
+                                    rows["Chemicals_cost_per_t"].to_numpy(dtype=float),
+                                    rows["Capex_per_t"].to_numpy(dtype=float), energy_price)
+    rec = recovery_grid([org for _, org in pairs], metals, pH, T, O, catalog)
+    grams_per_t = np.array([composition[m] for m in metals], dtype=float)
+    grams = np.tensordot(grams_per_t, rec, axes=([0], [1]))
+    total_cost = (total_cost.reshape((-1,) + (1,) * (grams.ndim - 1))
+                  + np.asarray(extra_energy, dtype=float) * energy_price)
+    return methods, np.where(grams > 0, total_cost / np.where(grams > 0, grams, 1.0), np.inf)
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# Cost Model Constants
+# -----------------------------
+ENERGY_PRICE = 0.1   # assume $0.1 per kWh
+
+PARAM_COLUMNS = [
+    "Energy_kWh_per_t",
+    "Chemicals_cost_per_t",
+    "Capex_per_t",
+    "Au_recovery",
+    "Pd_recovery",
+    "Cu_recovery",
+]
+
+RESULT_COLUMNS = [
+    "Energy (kWh/t)",
+    "Chemicals ($/t)",
+    "Capex ($/t)",
+    "Energy cost ($/t)",
+    "Total cost ($/t)",
+    "Au recovery",
+    "Pd recovery",
+    "Cu recovery",
+]
+
+
+# -----------------------------
+# Vectorized Evaluation
+# -----------------------------
+def cost_components(energy, chemicals_cost, capex, energy_price=ENERGY_PRICE):
+    """Energy cost and total cost ($/t) for arrays of any matching shape."""
+    energy_cost = energy * energy_price
+    total_cost = chemicals_cost + capex + energy_cost
+    return energy_cost, total_cost
+
+
+def evaluate_methods(df, energy_price=ENERGY_PRICE):
+    """Evaluate every method row of a parameter table in one pass."""
+    energy = df["Energy_kWh_per_t"].to_numpy(dtype=float)
+    chemicals_cost = df["Chemicals_cost_per_t"].to_numpy(dtype=float)
+    capex = df["Capex_per_t"].to_numpy(dtype=float)
+
+    energy_cost, total_cost = cost_components(energy, chemicals_cost, capex, energy_price)
+
+    return pd.DataFrame(
+        {
+            "Energy (kWh/t)": energy,
+            "Chemicals ($/t)": chemicals_cost,
+            "Capex ($/t)": capex,
+            "Energy cost ($/t)": energy_cost,
+            "Total cost ($/t)": total_cost,
+            "Au recovery": df["Au_recovery"].to_numpy(dtype=float),
+            "Pd recovery": df["Pd_recovery"].to_numpy(dtype=float),
+            "Cu recovery": df["Cu_recovery"].to_numpy(dtype=float),
+        },
+        index=pd.Index(df.index, name="Method"),
+    )
+
+
+def evaluate_method(name, energy, chemicals_cost, capex, recovery, energy_price=ENERGY_PRICE):
+    """Single-row wrapper around evaluate_methods."""
+    row = pd.DataFrame(
+        {
+            "Energy_kWh_per_t": [energy],
+            "Chemicals_cost_per_t": [chemicals_cost],
+            "Capex_per_t": [capex],
+            "Au_recovery": [recovery["Au"]],
+            "Pd_recovery": [recovery["Pd"]],
+            "Cu_recovery": [recovery["Cu"]],
+        },
+        index=[name],
+    )
+    result = evaluate_methods(row, energy_price)
+    return {"Method": name, **{col: result[col].iloc[0] for col in RESULT_COLUMNS}}
+
+
+# -----------------------------
+# Energy Price Sweeps
+# -----------------------------
+SWEEP_PRICE = "Energy price ($/kWh)"
+
+
+def tariff_price(rates, shares):
+    """Consumption-weighted price ($/kWh) of time-of-use tariff profiles.
+
+    rates holds the price of each tariff period and shares the energy drawn
+    in each period, both along the last axis. Total cost is linear in the
+    energy price, so a profile costs exactly what this flat price costs.
+    A stack of profiles gives one price per profile.
+    """
+    rates, shares = np.broadcast_arrays(np.asarray(rates, dtype=float),
+                                        np.asarray(shares, dtype=float))
+    return (rates * shares).sum(axis=-1) / shares.sum(axis=-1)
+
+
+def price_sweep(df, prices):
+    """Total cost ($/t) of every method at every energy price (prices x methods)."""
+    prices = np.atleast_1d(np.asarray(prices, dtype=float))
+    _, total_cost = cost_components(
+        df["Energy_kWh_per_t"].to_numpy(dtype=float)[None, :],
+        df["Chemicals_cost_per_t"].to_numpy(dtype=float)[None, :],
+        df["Capex_per_t"].to_numpy(dtype=float)[None, :],
+        prices[:, None],
+    )
+    return pd.DataFrame(total_cost, index=pd.Index(prices, name=SWEEP_PRICE),
+                        columns=pd.Index(df.index, name="Method"))
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+from .cost_model import ENERGY_PRICE, SWEEP_PRICE
+from .revenue import DEFAULT_PRICES, REVENUE_METALS, recovery_matrix
+
+# -----------------------------
+# Pairwise Crossover Points
+# -----------------------------
+# Cost and margin are linear in the energy price, in each metal price and in
+# 1 / throughput, so every method is a line y = a + b * x in the chosen
+# variable and each pair of lines meets at x = (a_j - a_i) / (b_i - b_j).
+# All pairs are solved at once as (methods x methods) arrays. Cells with
+# parallel lines or a crossing outside the variable's domain are NaN.
+
+
+def crossover_matrix(intercept, slope, index, low=0.0, high=np.inf):
+    """(methods x methods) frame of x where a + b * x is equal for both methods."""
+    a = np.asarray(intercept, dtype=float)
+    b = np.asarray(slope, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = (a[None, :] - a[:, None]) / (b[:, None] - b[None, :])
+    x[~np.isfinite(x) | (x < low) | (x > high)] = np.nan
+    methods = pd.Index(index, name="Method")
+    return pd.DataFrame(x, index=methods, columns=methods)
+
+
+def energy_price_crossovers(results):
+    """Energy price ($/kWh) at which each pair of methods costs the same.
+
+    Above the crossing the method using less energy is cheaper.
+    """
+    fixed = (results["Chemicals ($/t)"].to_numpy(dtype=float)
+             + results["Capex ($/t)"].to_numpy(dtype=float))
+    return crossover_matrix(fixed, results["Energy (kWh/t)"].to_numpy(dtype=float), results.index)
+
+
+def price_breakevens(df, low=0.0, high=np.inf):
+    """Energy prices in [low, high] at which two methods of a parameter table
+    swap cost ranking, one row per pair sorted by price.
+
+    The pairs are the upper triangle of crossover_matrix; below the crossing
+    the more energy-hungry method is the cheaper one.
+    """
+    energy = df["Energy_kWh_per_t"].to_numpy(dtype=float)
+    fixed = (df["Chemicals_cost_per_t"].to_numpy(dtype=float)
+             + df["Capex_per_t"].to_numpy(dtype=float))
+    x = crossover_matrix(fixed, energy, df.index, low, high).to_numpy()
+    i, j = np.triu_indices(len(df), k=1)
+    keep = ~np.isnan(x[i, j])
+    i, j = i[keep], j[keep]
+    price = x[i, j]
+    below = np.where(energy[i] > energy[j], i, j)
+    above = np.where(energy[i] > energy[j], j, i)
+    order = np.argsort(price, kind="stable")
+
+    names = np.asarray(df.index)
+    return pd.DataFrame({
+        SWEEP_PRICE: price[order],
+        "Cheaper below": names[below[order]],
+        "Cheaper above": names[above[order]],
+        "Total cost ($/t)": (fixed[i] + energy[i] * price)[order],
+    })
+
+
+def throughput_crossovers(results, energy_price=ENERGY_PRICE):
+    """Throughput (x the workbook plant size) at which each pair costs the same.
+
+    Capex per ton is taken to scale with 1 / throughput, while energy and
+    chemicals per ton stay fixed. Above the crossing the method with the
+    higher capex is cheaper.
+    """
+    variable = (results["Chemicals ($/t)"].to_numpy(dtype=float)
+                + results["Energy (kWh/t)"].to_numpy(dtype=float) * energy_price)
+    capex = results["Capex ($/t)"].to_numpy(dtype=float)
+    # Lines in u = 1 / throughput; map the crossings back to throughput
+    u = crossover_matrix(variable, capex, results.index).to_numpy()
+    with np.errstate(divide="ignore"):
+        x = 1.0 / u
+    x[~np.isfinite(x)] = np.nan
+    return pd.DataFrame(x, index=results.index, columns=results.index)
+
+
+def metal_price_crossovers(results, composition, metal, prices=None, metals=REVENUE_METALS):
+    """Price of one metal ($/g) at which each pair of methods earns the same margin.
+
+    composition is one feedstock stream (g/t per metal); the other metals
+    are held at prices. Above the crossing the method recovering more of
+    the metal has the higher margin.
+    """
+    prices = DEFAULT_PRICES if prices is None else prices
+    grams = (np.array([composition[m] for m in metals], dtype=float)
+             * recovery_matrix(results, metals))
+    k = metals.index(metal)
+    others = np.array([0.0 if m == metal else prices[m] for m in metals], dtype=float)
+    intercept = grams @ others - results["Total cost ($/t)"].to_numpy(dtype=float)
+    return crossover_matrix(intercept, grams[:, k], results.index)
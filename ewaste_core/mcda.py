@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+
+from .pareto import PARETO_OBJECTIVES
+
+# -----------------------------
+# Multi-Criteria Ranking
+# -----------------------------
+# Criteria map results_df columns to "min" or "max". Both scoring methods
+# accept a single weight vector or a (draws x criteria) stack of them and
+# return one score per draw and method, so SMAA ranks every sampled weight
+# vector with the same array operations as a single ranking.
+CRITERIA = PARETO_OBJECTIVES
+SMAA_BATCH = 5_000_000   # draws x methods x criteria elements scored at once
+
+
+def _criteria_matrix(results, criteria):
+    criteria = CRITERIA if criteria is None else criteria
+    x = results[list(criteria)].to_numpy(dtype=float)
+    benefit = np.array([sense == "max" for sense in criteria.values()])
+    return x, benefit
+
+
+def _weights(weights, criteria):
+    """Normalized weights; dicts are ordered like criteria, None means equal."""
+    criteria = CRITERIA if criteria is None else criteria
+    if weights is None:
+        weights = np.ones(len(criteria))
+    elif isinstance(weights, dict):
+        weights = [weights.get(c, 0.0) for c in criteria]
+    w = np.asarray(weights, dtype=float)
+    total = w.sum(axis=-1, keepdims=True)
+    if np.any(total <= 0):
+        raise ValueError("Criterion weights must have a positive sum")
+    return w / total
+
+
+def weighted_sum_scores(x, benefit, weights):
+    """Weighted sum of min-max scaled criteria (1 = best), per weight vector."""
+    lo, hi = x.min(axis=0), x.max(axis=0)
+    span = np.where(hi > lo, hi - lo, 1.0)
+    u = np.where(benefit, x - lo, hi - x) / span
+    return weights @ u.T
+
+
+def topsis_scores(x, benefit, weights):
+    """TOPSIS closeness to the ideal solution, per weight vector."""
+    norm = np.sqrt((x ** 2).sum(axis=0))
+    r = x / np.where(norm > 0, norm, 1.0)
+    best = np.where(benefit, r.max(axis=0), r.min(axis=0))
+    worst = np.where(benefit, r.min(axis=0), r.max(axis=0))
+    w = np.asarray(weights)[..., None, :]
+    d_best = np.sqrt(((w * (r - best)) ** 2).sum(axis=-1))
+    d_worst = np.sqrt(((w * (r - worst)) ** 2).sum(axis=-1))
+    total = d_best + d_worst
+    return np.where(total > 0, d_worst / np.where(total > 0, total, 1.0), 0.0)
+
+
+SCORERS = {"Weighted sum": weighted_sum_scores, "TOPSIS": topsis_scores}
+
+
+def mcda_ranking(results, weights=None, criteria=None):
+    """Weighted-sum and TOPSIS scores and ranks (1 = best) for every method."""
+    x, benefit = _criteria_matrix(results, criteria)
+    w = _weights(weights, criteria)
+    out = {}
+    for name, scorer in SCORERS.items():
+        score = scorer(x, benefit, w)
+        out[f"{name} score"] = score
+        out[f"{name} rank"] = pd.Series(score).rank(ascending=False, method="min").to_numpy(int)
+    return pd.DataFrame(out, index=pd.Index(results.index, name="Method"))
+
+
+def smaa(results, n=100_000, method="TOPSIS", criteria=None, seed=None):
+    """Rank acceptability: probability of each method taking each rank.
+
+    Weight vectors are drawn uniformly from the simplex (no preference
+    information) and scored in chunks of about SMAA_BATCH elements. Returns a
+    (methods x ranks) frame whose rows sum to 1.
+    """
+    x, benefit = _criteria_matrix(results, criteria)
+    scorer = SCORERS[method]
+    m, c = x.shape
+    rng = np.random.default_rng(seed)
+    counts = np.zeros(m * m, dtype=np.int64)
+    chunk = max(1, SMAA_BATCH // (m * c))
+    for start in range(0, n, chunk):
+        k = min(chunk, n - start)
+        weights = rng.dirichlet(np.ones(c), size=k)
+        scores = scorer(x, benefit, weights)
+        # Position of each method in the descending order of its draw
+        order = np.argsort(-scores, axis=1, kind="stable")
+        rank = np.empty_like(order)
+        np.put_along_axis(rank, order, np.arange(m)[None, :], axis=1)
+        counts += np.bincount((np.arange(m)[None, :] * m + rank).ravel(), minlength=m * m)
+
+    columns = pd.Index([f"Rank {r}" for r in range(1, m + 1)], name="Rank")
+    return pd.DataFrame(counts.reshape(m, m) / n, index=pd.Index(results.index, name="Method"),
+                        columns=columns)
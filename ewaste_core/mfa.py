@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+
+from .revenue import DEFAULT_PRICES, REVENUE_METALS, recovered_mass, revenue_and_margin
+
+# -----------------------------
+# Dynamic Material-Flow Model
+# -----------------------------
+# E-waste generated in year t is the sales of every earlier year s times the
+# share of those products discarded at age t - s:
+#
+#   W[t] = sum_s sales[s] * f(t - s)
+#
+# where f is a discrete Weibull lifetime distribution per product. The
+# convolution runs along the year axis with FFTs, batched over products and
+# Monte Carlo draws. egypt_sales.csv and product_lifetimes.csv hold
+# indicative series and lifetimes; replace them with national statistics.
+LIFETIME_CV = 0.1     # relative spread of the Weibull shape and scale per draw
+SALES_CV = 0.1        # relative spread of each product's sales level per draw
+
+
+def weibull_pmf(shape, scale, n_years):
+    """Share discarded at ages 0..n_years-1, shape (*broadcast(shape, scale), n_years).
+
+    Age a covers the interval [a, a + 1) after the year of sale.
+    """
+    shape = np.asarray(shape, dtype=float)[..., None]
+    scale = np.asarray(scale, dtype=float)[..., None]
+    edges = np.arange(n_years + 1, dtype=float)
+    survival = np.exp(-np.float_power(edges / scale, shape))
+    return survival[..., :-1] - survival[..., 1:]
+
+
+def lifetime_convolve(sales, pmf):
+    """Outflow of each year: sales (..., years) convolved with pmf (..., ages).
+
+    Both broadcast over their leading axes; the result keeps the sales years.
+    """
+    sales = np.asarray(sales, dtype=float)
+    n_years = sales.shape[-1]
+    n = n_years + pmf.shape[-1] - 1
+    n_fft = 1 << (n - 1).bit_length()
+    out = np.fft.irfft(np.fft.rfft(sales, n_fft) * np.fft.rfft(pmf, n_fft), n_fft)
+    return out[..., :n_years]
+
+
+def ewaste_generation(sales, lifetimes):
+    """E-waste generated (t/yr) per product, with the shape of the sales frame."""
+    products = list(sales.columns)
+    pmf = weibull_pmf(lifetimes.loc[products, "weibull_shape"].to_numpy(),
+                      lifetimes.loc[products, "weibull_scale"].to_numpy(), len(sales))
+    flows = lifetime_convolve(sales.to_numpy(dtype=float).T, pmf)
+    return pd.DataFrame(flows.T, index=sales.index, columns=sales.columns)
+
+
+def in_use_stock(sales, generation):
+    """Products in use (t) at the end of each year."""
+    return sales.cumsum() - generation.cumsum()
+
+
+def generation_draws(sales, lifetimes, n_draws=1000, lifetime_cv=LIFETIME_CV, sales_cv=SALES_CV,
+                     seed=None):
+    """Monte Carlo e-waste generation, shape (draws, products, years).
+
+    Each draw scales every product's sales and its Weibull shape and scale
+    by independent lognormal factors with the given relative spreads; all
+    draws are convolved in one batched FFT.
+    """
+    products = list(sales.columns)
+    rng = np.random.default_rng(seed)
+    size = (n_draws, len(products))
+
+    def factor(cv):
+        sigma = np.sqrt(np.log1p(cv ** 2))
+        return rng.lognormal(-0.5 * sigma ** 2, sigma, size)
+
+    shape = lifetimes.loc[products, "weibull_shape"].to_numpy(dtype=float) * factor(lifetime_cv)
+    scale = lifetimes.loc[products, "weibull_scale"].to_numpy(dtype=float) * factor(lifetime_cv)
+    level = factor(sales_cv)
+    pmf = weibull_pmf(shape, scale, len(sales))
+    return lifetime_convolve(sales.to_numpy(dtype=float).T * level[..., None], pmf)
+
+
+def generation_bands(draws, years, percentiles=(5, 50, 95)):
+    """Percentiles of total generation (t/yr) across draws, indexed by year."""
+    total = draws.sum(axis=1)
+    bands = np.percentile(total, percentiles, axis=0)
+    return pd.DataFrame(bands.T, index=pd.Index(years, name="Year"),
+                        columns=[f"P{p}" for p in percentiles])
+
+
+# -----------------------------
+# National Flows Through the Cost Engine
+# -----------------------------
+def stream_tonnage(generation, lifetimes):
+    """Tonnage per feedstock stream per year, from product generation.
+
+    Each product sends stream_share of its mass to its stream (e.g. the
+    boards of a television); the rest is outside the per-ton models.
+    """
+    products = list(generation.columns)
+    share = lifetimes.loc[products, "stream_share"].to_numpy(dtype=float)
+    streams = lifetimes.loc[products, "stream"]
+    tonnage = generation * share
+    return tonnage.T.groupby(streams.to_numpy()).sum().T.rename_axis(columns="Stream")
+
+
+def national_flows(tonnage, composition, results, prices=None, metals=REVENUE_METALS):
+    """Yearly totals if all stream tonnage went through each method.
+
+    tonnage: years x streams (t/yr); composition and results as for
+    revenue_and_margin. Returns {quantity: years x methods frame} with
+    total cost and margin in $ and recovered metal in kg per metal.
+    """
+    prices = DEFAULT_PRICES if prices is None else prices
+    streams = list(tonnage.columns)
+    comp = composition.loc[streams]
+    t = tonnage.to_numpy(dtype=float)
+    methods = pd.Index(results.index, name="Method")
+
+    def frame(values):
+        return pd.DataFrame(values, index=tonnage.index, columns=methods)
+
+    _, margin = revenue_and_margin(comp, results, prices, metals)
+    cost = np.outer(t.sum(axis=1), results["Total cost ($/t)"].to_numpy(dtype=float))
+    grams = np.tensordot(t, recovered_mass(comp, results, metals), axes=([1], [0]))
+    flows = {"Total cost ($)": frame(cost), "Margin ($)": frame(t @ margin.to_numpy())}
+    for k, metal in enumerate(metals):
+        flows[f"{metal} recovered (kg)"] = frame(grams[..., k] / 1000.0)
+    return flows
@@ -0,0 +1,221 @@
+import numpy as np
+import pandas as pd
+
+from .cost_model import ENERGY_PRICE, PARAM_COLUMNS, cost_components
+
+# -----------------------------
+# Distribution Specification
+# -----------------------------
+# Each parameter column P may be given optional companion columns in the
+# workbook:
+#   P_dist  - "triangular" (default when bounds exist), "uniform" or "normal"
+#   P_low   - lower bound (normal: 2.5th percentile)
+#   P_high  - upper bound (normal: 97.5th percentile)
+# The point value in P is the mode (triangular) or mean (normal). Methods
+# without bounds keep their point value in every sample.
+DISTRIBUTIONS = ("point", "triangular", "uniform", "normal")
+NORMAL_Z95 = 1.959963984540054
+
+OUTPUTS = ["Total cost ($/t)", "Au recovery", "Pd recovery", "Cu recovery"]
+HIST_BINS = 16384
+MC_BATCH = 500_000      # methods x samples drawn per chunk
+MC_METHOD_BLOCK = 32    # methods whose histograms are held at once (~16 MB)
+
+
+def parameter_distributions(df):
+    """Per-parameter (kind, low, mode, high) arrays, one entry per method."""
+    specs = {}
+    for col in PARAM_COLUMNS:
+        mode = df[col].to_numpy(dtype=float)
+        low = _bound(df, f"{col}_low", mode)
+        high = _bound(df, f"{col}_high", mode)
+        has_bounds = ~np.isclose(low, high)
+
+        if f"{col}_dist" in df.columns:
+            kind = df[f"{col}_dist"].fillna("triangular").str.lower().to_numpy()
+        else:
+            kind = np.full(len(df), "triangular", dtype=object)
+        unknown = set(kind) - set(DISTRIBUTIONS)
+        if unknown:
+            raise ValueError(f"Unknown distribution for {col}: {sorted(unknown)}")
+        kind = np.where(has_bounds, kind, "point")
+
+        specs[col] = (kind, low, mode, high)
+    return specs
+
+
+def varied_parameters(df):
+    """Parameter columns that have a distribution for at least one method."""
+    return [col for col, (kind, *_) in parameter_distributions(df).items()
+            if (kind != "point").any()]
+
+
+def _bound(df, name, default):
+    if name not in df.columns:
+        return default.copy()
+    values = df[name].to_numpy(dtype=float)
+    return np.where(np.isnan(values), default, values)
+
+
+def _sample(rng, spec, n):
+    kind, low, mode, high = spec
+    out = np.repeat(mode[:, None], n, axis=1)
+    for dist in DISTRIBUTIONS[1:]:
+        rows = np.flatnonzero(kind == dist)
+        if not len(rows):
+            continue
+        size = (len(rows), n)
+        lo, md, hi = low[rows, None], mode[rows, None], high[rows, None]
+        if dist == "triangular":
+            out[rows] = rng.triangular(lo, np.clip(md, lo, hi), hi, size=size)
+        elif dist == "uniform":
+            out[rows] = rng.uniform(lo, hi, size=size)
+        else:
+            out[rows] = rng.normal(md, (hi - lo) / (2 * NORMAL_Z95), size=size)
+    return out
+
+
+def _support(spec):
+    kind, low, mode, high = spec
+    sd = (high - low) / (2 * NORMAL_Z95)
+    lo = np.where(kind == "normal", mode - 6 * sd, low)
+    hi = np.where(kind == "normal", mode + 6 * sd, high)
+    return lo, hi
+
+
+# -----------------------------
+# Monte Carlo Engine
+# -----------------------------
+def simulate_chunk(specs, n, rng, energy_price=ENERGY_PRICE):
+    """Draw n samples for every method; returns {output: (methods, n) array}."""
+    energy = _sample(rng, specs["Energy_kWh_per_t"], n)
+    chemicals_cost = _sample(rng, specs["Chemicals_cost_per_t"], n)
+    capex = _sample(rng, specs["Capex_per_t"], n)
+    _, total_cost = cost_components(energy, chemicals_cost, capex, energy_price)
+
+    out = {"Total cost ($/t)": total_cost}
+    for metal in ["Au", "Pd", "Cu"]:
+        rec = _sample(rng, specs[f"{metal}_recovery"], n)
+        out[f"{metal} recovery"] = np.clip(rec, 0.0, 1.0)
+    return out
+
+
+def monte_carlo(df, n_samples=100_000, percentiles=(5, 50, 95), seed=None,
+                chunk_size=None, energy_price=ENERGY_PRICE):
+    """Percentile bands of total cost and recovery for every method.
+
+    Methods are run in blocks of MC_METHOD_BLOCK and each block's samples
+    are drawn as (methods x chunk) arrays of about MC_BATCH elements (or
+    chunk_size samples) and folded into fixed-bin histograms, so memory
+    grows with neither n_samples nor the number of methods. Each chunk
+    draws from its own child of SeedSequence(seed), so any split of the
+    chunks across processes reproduces the serial result exactly.
+    """
+    specs = parameter_distributions(df)
+    ranges = histogram_ranges(specs, energy_price)
+    tables = []
+    for rows, plan in monte_carlo_plan(len(df), n_samples, chunk_size, seed):
+        block_specs, block_ranges = block_inputs(specs, ranges, rows)
+        counts, sums = None, None
+        for n, seed_seq in plan:
+            chunk_counts, chunk_sums = accumulate_chunk(block_specs, block_ranges, n, seed_seq,
+                                                        energy_price)
+            counts, sums = merge_chunk(counts, sums, chunk_counts, chunk_sums)
+        tables.append(summarize(df.index[rows], block_ranges, counts, sums, n_samples,
+                                percentiles))
+    return pd.concat(tables)
+
+
+def histogram_ranges(specs, energy_price=ENERGY_PRICE):
+    """Histogram (low, high) per output and method, from the parameter support."""
+    e_lo, e_hi = _support(specs["Energy_kWh_per_t"])
+    c_lo, c_hi = _support(specs["Chemicals_cost_per_t"])
+    k_lo, k_hi = _support(specs["Capex_per_t"])
+    ranges = {"Total cost ($/t)": (cost_components(e_lo, c_lo, k_lo, energy_price)[1],
+                                   cost_components(e_hi, c_hi, k_hi, energy_price)[1])}
+    for metal in ["Au", "Pd", "Cu"]:
+        lo, hi = _support(specs[f"{metal}_recovery"])
+        ranges[f"{metal} recovery"] = (np.clip(lo, 0.0, 1.0), np.clip(hi, 0.0, 1.0))
+    return ranges
+
+
+def chunk_plan(n_samples, chunk_size, seed):
+    """(sample count, SeedSequence) for every chunk, in order."""
+    seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    sizes = [min(chunk_size, n_samples - start) for start in range(0, n_samples, chunk_size)]
+    return list(zip(sizes, seed_seq.spawn(len(sizes))))
+
+
+def monte_carlo_plan(n_methods, n_samples, chunk_size=None, seed=None):
+    """(method slice, chunk_plan) for every block of methods, in order.
+
+    Depends only on its arguments, so the serial and parallel runs draw the
+    same samples.
+    """
+    starts = range(0, max(n_methods, 1), MC_METHOD_BLOCK)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    plan = []
+    for start, seed_seq in zip(starts, seeds):
+        rows = slice(start, min(start + MC_METHOD_BLOCK, n_methods))
+        size = chunk_size or max(1, MC_BATCH // max(rows.stop - rows.start, 1))
+        plan.append((rows, chunk_plan(n_samples, size, seed_seq)))
+    return plan
+
+
+def block_inputs(specs, ranges, rows):
+    """specs and histogram ranges restricted to one block of methods."""
+    return ({col: tuple(a[rows] for a in spec) for col, spec in specs.items()},
+            {key: (lo[rows], hi[rows]) for key, (lo, hi) in ranges.items()})
+
+
+def accumulate_chunk(specs, ranges, n, seed_seq, energy_price=ENERGY_PRICE):
+    """Histogram counts and sums of one chunk of samples."""
+    chunk = simulate_chunk(specs, n, np.random.default_rng(seed_seq), energy_price)
+    n_methods = len(specs["Energy_kWh_per_t"][0])
+    offsets = (np.arange(n_methods) * HIST_BINS)[:, None]
+
+    counts, sums = {}, {}
+    for key in OUTPUTS:
+        lo, hi = ranges[key]
+        scale = HIST_BINS / np.where(hi > lo, hi - lo, 1.0)
+        idx = ((chunk[key] - lo[:, None]) * scale[:, None]).astype(np.int64)
+        np.clip(idx, 0, HIST_BINS - 1, out=idx)
+        idx += offsets
+        counts[key] = np.bincount(idx.ravel(), minlength=n_methods * HIST_BINS)
+        sums[key] = chunk[key].sum(axis=1)
+    return counts, sums
+
+
+def merge_chunk(counts, sums, chunk_counts, chunk_sums):
+    # Float sums must be merged in chunk order to stay reproducible
+    if counts is None:
+        return chunk_counts, chunk_sums
+    for key in OUTPUTS:
+        counts[key] += chunk_counts[key]
+        sums[key] += chunk_sums[key]
+    return counts, sums
+
+
+def summarize(index, ranges, counts, sums, n_samples, percentiles=(5, 50, 95)):
+    """Mean and percentile table from merged histogram counts and sums."""
+    columns = {}
+    for key in OUTPUTS:
+        lo, hi = ranges[key]
+        hist = counts[key].reshape(len(index), HIST_BINS)
+        columns[(key, "mean")] = sums[key] / n_samples
+        for q in percentiles:
+            columns[(key, f"P{q:g}")] = _hist_percentile(hist, lo, hi, q / 100)
+
+    return pd.DataFrame(columns, index=pd.Index(index, name="Method"))
+
+
+def _hist_percentile(hist, lo, hi, q):
+    cum = hist.cumsum(axis=1)
+    total = cum[:, -1]
+    target = q * total
+    k = np.minimum((cum < target[:, None]).sum(axis=1), HIST_BINS - 1)
+    rows = np.arange(len(hist))
+    before = np.where(k > 0, cum[rows, k - 1], 0)
+    frac = (target - before) / np.maximum(hist[rows, k], 1)
+    width = (hi - lo) / HIST_BINS
+    return np.where(hi > lo, lo + (k + frac) * width, lo)
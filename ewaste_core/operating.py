@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+from .bioleaching import O_AXIS, PH_AXIS, T_AXIS, recovery_grid
+from .biolink import bio_cost_per_gram, linked_methods
+from .cost_model import ENERGY_PRICE
+from .revenue import REVENUE_METALS
+
+# -----------------------------
+# Tank Heating and Aeration Energy
+# -----------------------------
+# Energy (kWh per ton of e-waste) to hold a stirred bioleaching tank at
+# temperature T and dissolved O2 setpoint O for one residence time.
+#
+# Heating: the slurry is brought from ambient to T once, and the tank then
+# loses heat in proportion to (T - ambient). Cooling below ambient is not
+# modelled and costs nothing.
+#
+# Aeration: at steady state oxygen transfer matches the uptake rate,
+#   kLa * (C* - O) = OUR,
+# where C*(T) is the air-saturated DO. Power per volume follows the van't
+# Riet correlation for coalescing broths, kLa = KLA_COEF * (P/V)^KLA_EXP,
+# at a fixed superficial gas velocity. A setpoint at or above C* cannot be
+# reached with air and needs infinite energy.
+#
+# The workbook energy of a bio method is taken to cover operation at
+# ambient temperature; these terms come on top of it.
+AMBIENT_T = 25.0          # °C
+SLURRY_M3_PER_T = 10.0    # m³ of liquid per ton of e-waste (10% pulp density)
+RESIDENCE_DAYS = 10.0
+CP_WATER = 4.186          # kJ/(kg K)
+HEATER_EFFICIENCY = 0.9
+HEAT_LOSS = 5.0           # W per m³ of tank per K above ambient
+OUR = 100.0               # mg O2 per L per h
+KLA_COEF = 0.026 * 0.005 ** 0.5   # 1/s per (W/m³)^KLA_EXP, superficial gas velocity 5 mm/s
+KLA_EXP = 0.4
+
+
+def o2_saturation(T):
+    """Air-saturated dissolved O2 (mg/L) in fresh water at 1 atm."""
+    T = np.asarray(T, dtype=float)
+    return 14.652 - 0.41022 * T + 0.007991 * T ** 2 - 0.000077774 * T ** 3
+
+
+def heating_energy(T, ambient=AMBIENT_T, days=RESIDENCE_DAYS):
+    """Heating energy (kWh/t) to reach and hold T for one residence time."""
+    dT = np.maximum(np.asarray(T, dtype=float) - ambient, 0.0)
+    warm_up = SLURRY_M3_PER_T * 1000.0 * CP_WATER * dT / 3600.0
+    losses = HEAT_LOSS * SLURRY_M3_PER_T * dT * days * 24.0 / 1000.0
+    return (warm_up + losses) / HEATER_EFFICIENCY
+
+
+def aeration_energy(T, O, days=RESIDENCE_DAYS, our=OUR):
+    """Aeration energy (kWh/t) to hold DO at O against uptake rate our (mg/L/h)."""
+    T, O = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(O, dtype=float))
+    deficit = o2_saturation(T) - O
+    kla = our / np.where(deficit > 0, deficit, 1.0) / 3600.0
+    power = np.float_power(kla / KLA_COEF, 1.0 / KLA_EXP)
+    energy = power * SLURRY_M3_PER_T * days * 24.0 / 1000.0
+    return np.where(deficit > 0, energy, np.inf)
+
+
+def operating_energy(T, O, ambient=AMBIENT_T, days=RESIDENCE_DAYS, our=OUR):
+    """Heating plus aeration energy (kWh/t), broadcast over T and O."""
+    return heating_energy(T, ambient, days) + aeration_energy(T, O, days, our)
+
+
+def link_operating_energy(df, T, O, ambient=AMBIENT_T, organisms=None):
+    """Copy of a parameter table with heating and aeration energy added to
+    the linked Bio_* rows at one set of operating conditions."""
+    out = df.copy()
+    methods = [m for m, _ in linked_methods(df, organisms)]
+    out["Energy_kWh_per_t"] = out["Energy_kWh_per_t"].astype(float)
+    out.loc[methods, "Energy_kWh_per_t"] += float(operating_energy(T, O, ambient))
+    return out
+
+
+# -----------------------------
+# Cost per Recovered kg
+# -----------------------------
+def bio_cost_per_kg(df, composition, pH, T, O, metals=REVENUE_METALS, energy_price=ENERGY_PRICE,
+                    ambient=AMBIENT_T, organisms=None, catalog=None):
+    """Cost per recovered kg ($/kg) of the linked Bio_* methods including
+    heating and aeration, over broadcast conditions (see bio_cost_per_gram)."""
+    extra = operating_energy(T, O, ambient)
+    methods, per_gram = bio_cost_per_gram(df, composition, pH, T, O, metals, organisms,
+                                          energy_price, extra, catalog)
+    return methods, per_gram * 1000.0
+
+
+def economic_optimum(df, composition, metals=REVENUE_METALS, energy_price=ENERGY_PRICE,
+                     ambient=AMBIENT_T, pH_axis=PH_AXIS, T_axis=T_AXIS, O_axis=O_AXIS,
+                     organisms=None, catalog=None):
+    """Cheapest conditions per recovered kg for every linked Bio_* method.
+
+    The whole (pH x T x DO) grid is costed in one pass; the recovery at the
+    economic optimum is reported next to the best achievable recovery.
+    """
+    pH, T, O = pH_axis[:, None, None], T_axis[None, :, None], O_axis[None, None, :]
+    methods, cost = bio_cost_per_kg(df, composition, pH, T, O, metals, energy_price, ambient,
+                                    organisms, catalog)
+    pairs = linked_methods(df, organisms)
+    rec = recovery_grid([org for _, org in pairs], metals, pH, T, O, catalog)
+    grams_per_t = np.array([composition[m] for m in metals], dtype=float)
+    grams = np.tensordot(grams_per_t, rec, axes=([0], [1]))
+
+    flat = cost.reshape(len(methods), -1)
+    best = flat.argmin(axis=1)
+    i, j, k = np.unravel_index(best, cost.shape[1:])
+    return pd.DataFrame({
+        "Optimum pH": pH_axis[i],
+        "Optimum Temp (°C)": T_axis[j],
+        "Optimum DO (mg/L)": O_axis[k],
+        "Heating (kWh/t)": heating_energy(T_axis[j], ambient),
+        "Aeration (kWh/t)": aeration_energy(T_axis[j], O_axis[k]),
+        "Recovered (g/t)": grams.reshape(len(methods), -1)[np.arange(len(methods)), best],
+        "Max recoverable (g/t)": grams.reshape(len(methods), -1).max(axis=1),
+        "Cost ($/kg)": flat[np.arange(len(methods)), best],
+    }, index=pd.Index(methods, name="Method"))
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from .bioleaching import METALS, default_catalog, recovery_grid, recovery_points
+
+# -----------------------------
+# Optimum Operating Conditions
+# -----------------------------
+# The weighted synergy term and the Monod factor mean that (pH_opt, T_opt)
+# from the organism table is not necessarily the maximizer of
+# recovery_fraction inside a bounded window. The search below evaluates a
+# coarse grid in one recovery_grid call, then repeatedly zooms a small
+# grid around the best point of every organism/metal pair at once.
+PH_BOUNDS = (0.5, 4.0)
+T_BOUNDS = (15.0, 50.0)
+O_BOUNDS = (0.0, 10.0)
+
+
+def optimum_conditions(orgs=None, metals=METALS, pH_bounds=PH_BOUNDS, T_bounds=T_BOUNDS,
+                       O_bounds=O_BOUNDS, coarse=(36, 36, 21), rounds=6, zoom=4, catalog=None):
+    """Best (pH, T, DO) and recovery for every organism and metal within bounds."""
+    catalog = default_catalog() if catalog is None else catalog
+    orgs = list(catalog.names) if orgs is None else list(orgs)
+    metals = list(metals)
+    bounds = np.array([pH_bounds, T_bounds, O_bounds], dtype=float)
+    lo, hi = bounds[:, 0], bounds[:, 1]
+
+    # Coarse grid over the whole window
+    axes = [np.linspace(b0, b1, n) for (b0, b1), n in zip(bounds, coarse)]
+    grid = recovery_grid(orgs, metals, axes[0][:, None, None], axes[1][None, :, None],
+                         axes[2][None, None, :], catalog=catalog)
+    flat = grid.reshape(len(orgs), len(metals), -1)
+    best = np.unravel_index(flat.argmax(axis=-1), grid.shape[2:])
+    center = np.stack([ax[i] for ax, i in zip(axes, best)], axis=-1)
+    value = flat.max(axis=-1)
+    step = (hi - lo) / np.maximum(np.array(coarse) - 1, 1)
+
+    # Local refinement: (2*zoom+1)^3 candidates around each pair's best point
+    org_idx = catalog.org_indices(orgs)[:, None, None]
+    metal_idx = catalog.metal_indices(metals)[None, :, None]
+    offsets = np.linspace(-1.0, 1.0, 2 * zoom + 1)
+    mesh = np.stack(np.meshgrid(offsets, offsets, offsets, indexing="ij"), axis=-1).reshape(-1, 3)
+    for _ in range(rounds):
+        cand = np.clip(center[:, :, None, :] + mesh * step, lo, hi)
+        vals = recovery_points(org_idx, metal_idx, cand[..., 0], cand[..., 1], cand[..., 2],
+                               catalog=catalog)
+        pick = vals.argmax(axis=-1)
+        improved = np.take_along_axis(vals, pick[..., None], axis=-1)[..., 0] > value
+        chosen = np.take_along_axis(cand, pick[..., None, None], axis=2)[:, :, 0]
+        center = np.where(improved[..., None], chosen, center)
+        value = np.maximum(value, np.take_along_axis(vals, pick[..., None], axis=-1)[..., 0])
+        step = step / zoom
+
+    return pd.DataFrame({
+        "Bacteria": np.repeat(orgs, len(metals)),
+        "Metal": np.tile(metals, len(orgs)),
+        "Optimum pH": center[..., 0].ravel(),
+        "Optimum Temp (°C)": center[..., 1].ravel(),
+        "Optimum DO (mg/L)": center[..., 2].ravel(),
+        "Max Recovery (%)": value.ravel() * 100,
+    })
@@ -0,0 +1,254 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pandas as pd
+
+from .bioleaching import default_catalog, recovery_grid, recovery_points
+from .cost_model import ENERGY_PRICE
+from .montecarlo import (OUTPUTS, accumulate_chunk, block_inputs, histogram_ranges, monte_carlo,
+                         monte_carlo_plan, parameter_distributions, summarize)
+
+# -----------------------------
+# Shared-Memory Arrays
+# -----------------------------
+class SharedArray:
+    """NumPy array backed by a named shared-memory block.
+
+    Workers receive the small (name, shape, dtype) descriptor and map the
+    same buffer instead of unpickling a copy of the data. Only the creating
+    process unlinks the block; see attach for the resource tracker.
+    """
+
+    def __init__(self, shape, dtype=float, name=None):
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        self._owner = name is None
+        if self._owner or sys.version_info < (3, 13):
+            self.shm = shared_memory.SharedMemory(name=name, create=self._owner, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+
+    @classmethod
+    def copy_of(cls, values):
+        values = np.ascontiguousarray(values)
+        shared = cls(values.shape, values.dtype)
+        shared.array[...] = values
+        return shared
+
+    @property
+    def descriptor(self):
+        return self.shm.name, self.array.shape, self.array.dtype.str
+
+    @classmethod
+    def attach(cls, descriptor):
+        """Map a block created elsewhere without taking ownership of it.
+
+        From Python 3.13 the block is opened untracked. Earlier versions
+        always register it with the resource tracker, which unlinks it when
+        the process exits; that is harmless only in a process sharing the
+        owner's tracker, where the registration duplicates the owner's own.
+        SweepExecutor starts the tracker before its pool so workers share it.
+        """
+        name, shape, dtype = descriptor
+        return cls(shape, dtype, name=name)
+
+    def close(self):
+        self.array = None
+        self.shm.close()
+        if self._owner:
+            self.shm.unlink()
+
+
+# -----------------------------
+# Worker Tasks
+# -----------------------------
+# Each task maps its shared buffers, fills its shard and returns the CPU time
+# it spent, which the executor sums to report how busy the pool was.
+def _grid_task(catalog, orgs, metals, axes, out_desc, start, stop):
+    t0 = time.process_time()
+    out = SharedArray.attach(out_desc)
+    try:
+        pH_axis, T_axis, O_axis = axes
+        out.array[:, :, start:stop] = recovery_grid(
+            orgs, metals,
+            pH_axis[start:stop, None, None], T_axis[None, :, None], O_axis[None, None, :],
+            catalog=catalog,
+        )
+    finally:
+        out.close()
+    return time.process_time() - t0
+
+
+def _points_task(catalog, in_descs, out_desc, start, stop):
+    t0 = time.process_time()
+    shared = [SharedArray.attach(d) for d in in_descs]
+    out = SharedArray.attach(out_desc)
+    try:
+        org_idx, metal_idx, pH, T, O = (s.array[start:stop] for s in shared)
+        out.array[start:stop] = recovery_points(org_idx, metal_idx, pH, T, O, catalog=catalog)
+    finally:
+        for s in shared + [out]:
+            s.close()
+    return time.process_time() - t0
+
+
+def _monte_carlo_task(specs, ranges, plan, energy_price):
+    t0 = time.process_time()
+    counts, chunk_sums = None, []
+    for n, seed_seq in plan:
+        c, s = accumulate_chunk(specs, ranges, n, seed_seq, energy_price)
+        # Integer counts add exactly in any order; float sums go back per chunk
+        counts = _add(counts, c)
+        chunk_sums.append(s)
+    return counts, chunk_sums, time.process_time() - t0
+
+
+def _add(total, part):
+    return part if total is None else {k: total[k] + part[k] for k in OUTPUTS}
+
+
+# -----------------------------
+# Parallel Sweep Executor
+# -----------------------------
+class SweepExecutor:
+    """Shards recovery sweeps and Monte Carlo runs across a process pool.
+
+    Results are bit-identical to the serial functions (for a given seed in
+    the Monte Carlo case). After every call, last_report holds the worker
+    count, wall time, summed worker CPU time and their ratio
+    (cpu_utilization: busy workers on average, at most the worker count).
+    With measure_speedup=True every call also runs the serial function and
+    adds its wall time (serial_s) and the measured speedup, serial_s over
+    the parallel wall time; this roughly doubles the cost of a call.
+    """
+
+    def __init__(self, workers=None, measure_speedup=False):
+        self.workers = workers or os.cpu_count() or 1
+        self.measure_speedup = measure_speedup
+        # Workers must inherit this process's tracker (see SharedArray.attach)
+        resource_tracker.ensure_running()
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.last_report = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def shutdown(self):
+        self._pool.shutdown()
+
+    def _report(self, start, worker_times, shards):
+        wall = time.perf_counter() - start
+        busy = float(sum(worker_times))
+        self.last_report = {
+            "workers": self.workers,
+            "shards": shards,
+            "wall_s": wall,
+            "worker_s": busy,
+            "cpu_utilization": busy / wall if wall > 0 else float("nan"),
+        }
+
+    def _measure(self, serial, *args, **kwargs):
+        # Time the serial reference after the parallel run has been reported
+        if not self.measure_speedup:
+            return
+        start = time.perf_counter()
+        serial(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        wall = self.last_report["wall_s"]
+        self.last_report["serial_s"] = elapsed
+        self.last_report["speedup"] = elapsed / wall if wall > 0 else float("nan")
+
+    def _bounds(self, n, shards=None):
+        shards = max(1, min(n, shards or self.workers))
+        edges = np.linspace(0, n, shards + 1).astype(int)
+        return list(zip(edges[:-1], edges[1:]))
+
+    def recovery_grid(self, orgs, metals, pH_axis, T_axis, O_axis, catalog=None):
+        """Parallel recovery_grid over 1-D axes, sharded along pH."""
+        start = time.perf_counter()
+        catalog = default_catalog() if catalog is None else catalog
+        orgs, metals = list(orgs), list(metals)
+        axes = tuple(np.asarray(a, dtype=float) for a in (pH_axis, T_axis, O_axis))
+        out = SharedArray((len(orgs), len(metals), *(len(a) for a in axes)))
+        try:
+            bounds = self._bounds(len(axes[0]))
+            futures = [self._pool.submit(_grid_task, catalog, orgs, metals, axes,
+                                         out.descriptor, a, b)
+                       for a, b in bounds]
+            times = [f.result() for f in futures]
+            result = out.array.copy()
+        finally:
+            out.close()
+        self._report(start, times, len(bounds))
+        self._measure(recovery_grid, orgs, metals, axes[0][:, None, None], axes[1][None, :, None],
+                      axes[2][None, None, :], catalog=catalog)
+        return result
+
+    def recovery_points(self, orgs, metals, pH, T, O, catalog=None):
+        """Parallel recovery_points over 1-D condition arrays."""
+        start = time.perf_counter()
+        catalog = default_catalog() if catalog is None else catalog
+        inputs = [SharedArray.copy_of(a) for a in (
+            catalog.org_indices(orgs), catalog.metal_indices(metals),
+            np.asarray(pH, dtype=float), np.asarray(T, dtype=float), np.asarray(O, dtype=float),
+        )]
+        out = SharedArray(inputs[0].array.shape)
+        try:
+            bounds = self._bounds(len(out.array))
+            descs = [s.descriptor for s in inputs]
+            futures = [self._pool.submit(_points_task, catalog, descs, out.descriptor, a, b)
+                       for a, b in bounds]
+            times = [f.result() for f in futures]
+            result = out.array.copy()
+        finally:
+            for s in inputs + [out]:
+                s.close()
+        self._report(start, times, len(bounds))
+        self._measure(recovery_points, orgs, metals, pH, T, O, catalog=catalog)
+        return result
+
+    def monte_carlo(self, df, n_samples=100_000, percentiles=(5, 50, 95), seed=None,
+                    chunk_size=None, energy_price=ENERGY_PRICE):
+        """Parallel montecarlo.monte_carlo; contiguous chunk ranges per worker.
+
+        The next block of methods is submitted before the current one is
+        merged, so at most two blocks of histograms are held at once.
+        """
+        start = time.perf_counter()
+        specs = parameter_distributions(df)
+        ranges = histogram_ranges(specs, energy_price)
+        blocks = monte_carlo_plan(len(df), n_samples, chunk_size, seed)
+
+        def submit(rows, plan):
+            block_specs, block_ranges = block_inputs(specs, ranges, rows)
+            futures = [self._pool.submit(_monte_carlo_task, block_specs, block_ranges, plan[a:b],
+                                         energy_price)
+                       for a, b in self._bounds(len(plan))]
+            return rows, block_ranges, futures
+
+        tables, times = [], []
+        upcoming = submit(*blocks[0])
+        for k in range(len(blocks)):
+            rows, block_ranges, futures = upcoming
+            if k + 1 < len(blocks):
+                upcoming = submit(*blocks[k + 1])
+            counts, sums = None, None
+            for f in futures:
+                shard_counts, chunk_sums, elapsed = f.result()
+                times.append(elapsed)
+                counts = _add(counts, shard_counts)
+                for s in chunk_sums:
+                    sums = _add(sums, s)
+            tables.append(summarize(df.index[rows], block_ranges, counts, sums, n_samples,
+                                    percentiles))
+        self._report(start, times, len(times))
+        self._measure(monte_carlo, df, n_samples, percentiles, seed, chunk_size, energy_price)
+        return pd.concat(tables)
@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+import tempfile
+
+import pandas as pd
+
+# -----------------------------
+# Parameter Loader with Columnar Cache
+# -----------------------------
+# Parsing the workbook with openpyxl dominates a cold render, so the first
+# load converts it to Parquet under .param_cache/ next to the workbook.
+# The cache is reused while the workbook's mtime and size are unchanged;
+# if only the mtime moved, the content hash decides.
+PARAMS_FILE = "ewaste_parameters.xlsx"
+ORGANISMS_FILE = "organisms.csv"
+ORGANISMS_SHEET = "Organisms"
+FEEDSTOCK_FILE = "feedstock.csv"
+SALES_FILE = "egypt_sales.csv"
+LIFETIMES_FILE = "product_lifetimes.csv"
+CACHE_DIR = ".param_cache"
+
+
+def load_parameters(path=PARAMS_FILE):
+    """Method parameter table indexed by method name."""
+    cache_path, stamp_path = _cache_paths(path)
+    info = os.stat(path)
+    stamp = _read_stamp(stamp_path)
+    digest = None
+
+    if stamp and os.path.exists(cache_path):
+        fresh = stamp["mtime_ns"] == info.st_mtime_ns and stamp["size"] == info.st_size
+        if not fresh:
+            digest = _file_hash(path)
+            fresh = stamp["sha256"] == digest
+        if fresh:
+            try:
+                df = pd.read_parquet(cache_path)
+            except (ImportError, OSError, ValueError):
+                # Damaged or unreadable cache: rebuild it from the workbook
+                pass
+            else:
+                if digest is not None:
+                    # Same content under a new mtime: skip the hash next time
+                    try:
+                        _write_stamp(stamp_path, info, digest)
+                    except OSError:
+                        pass
+                return df
+
+    digest = _file_hash(path) if digest is None else digest
+    df = pd.read_excel(path, index_col=0)
+    try:
+        _atomic_write(cache_path, lambda tmp: df.to_parquet(tmp))
+        _write_stamp(stamp_path, info, digest)
+    except (ImportError, OSError):
+        # No Parquet engine or read-only checkout: serve the parsed workbook
+        pass
+    return df
+
+
+def load_organisms(path=ORGANISMS_FILE):
+    """Organism parameter table indexed by organism name.
+
+    Reads a CSV, or the "Organisms" sheet when given a workbook.
+    """
+    if os.path.splitext(path)[1].lower() in (".xlsx", ".xlsm", ".xls"):
+        df = pd.read_excel(path, sheet_name=ORGANISMS_SHEET, index_col=0)
+    else:
+        df = pd.read_csv(path, index_col=0)
+    df.index = df.index.astype(str).str.strip()
+    return df
+
+
+def load_feedstock(path=FEEDSTOCK_FILE):
+    """Feedstock composition (g/t of each metal) indexed by e-waste stream."""
+    return pd.read_csv(path, index_col=0)
+
+
+def load_sales(path=SALES_FILE):
+    """Products put on the market (t/yr), one column per product, indexed by year."""
+    return pd.read_csv(path, index_col=0)
+
+
+def load_lifetimes(path=LIFETIMES_FILE):
+    """Weibull lifetime parameters and feedstock stream, indexed by product."""
+    return pd.read_csv(path, index_col=0)
+
+
+def _cache_paths(path):
+    folder, name = os.path.split(os.path.abspath(path))
+    stem = os.path.splitext(name)[0]
+    cache_dir = os.path.join(folder, CACHE_DIR)
+    return (os.path.join(cache_dir, stem + ".parquet"),
+            os.path.join(cache_dir, stem + ".json"))
+
+
+def _file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _read_stamp(stamp_path):
+    try:
+        with open(stamp_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_stamp(stamp_path, info, digest):
+    stamp = {"mtime_ns": info.st_mtime_ns, "size": info.st_size, "sha256": digest}
+    _atomic_write(stamp_path, lambda tmp: _dump_json(tmp, stamp))
+
+
+def _dump_json(path, obj):
+    with open(path, "w") as f:
+        json.dump(obj, f)
+
+
+def _atomic_write(path, write):
+    # Write then rename so concurrent app processes and session threads
+    # never read a partial file; each writer gets its own temporary file
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
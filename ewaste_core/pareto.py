@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# Pareto Front (Skyline)
+# -----------------------------
+# Sort-filter skyline: rows are sorted by the sum of their range-normalized
+# objectives, ties broken lexicographically on the raw objectives. A row
+# that dominates another has a sum no larger (float rounding is monotone)
+# and wins any tie, so rows can only be dominated by rows before them. One
+# pass in blocks then keeps a running front: each block is checked against
+# the front found so far and against itself, and its survivors join the
+# front. The front is kept ordered by how many rows each member has
+# eliminated, so the strongest dominators are tried first and eliminated
+# rows skip the remaining checks. Work grows with rows x front size, which
+# is quadratic when most rows are on the front.
+PARETO_OBJECTIVES = {
+    "Total cost ($/t)": "min",
+    "Energy (kWh/t)": "min",
+    "Au recovery": "max",
+    "Pd recovery": "max",
+    "Cu recovery": "max",
+}
+PARETO_BLOCK = 1024
+PARETO_PROBE = 32    # front rows tried first; later probes grow to PARETO_BLOCK
+
+
+def _dominated(points, front):
+    """Mask of points dominated by any row of front (both minimized).
+
+    Also returns how many of the points each front row dominates.
+    """
+    out = np.zeros(len(points), dtype=bool)
+    hits = np.zeros(len(front), dtype=np.int64)
+    alive = np.arange(len(points))
+    start, step = 0, PARETO_PROBE
+    while start < len(front) and len(alive):
+        f = front[start:start + step]
+        p = points[alive]
+        le = np.ones((len(p), len(f)), dtype=bool)
+        lt = np.zeros((len(p), len(f)), dtype=bool)
+        for k in range(points.shape[1]):
+            le &= f[None, :, k] <= p[:, None, k]
+            lt |= f[None, :, k] < p[:, None, k]
+        le &= lt
+        hit = le.any(axis=1)
+        hits[start:start + len(f)] = le.sum(axis=0)
+        out[alive[hit]] = True
+        alive = alive[~hit]
+        start, step = start + step, min(4 * step, PARETO_BLOCK)
+    return out, hits
+
+
+def pareto_mask(values):
+    """Non-dominated rows of an (n x d) array with every objective minimized."""
+    values = np.asarray(values, dtype=float)
+    lo, hi = values.min(axis=0, initial=np.inf), values.max(axis=0, initial=-np.inf)
+    span = np.where(hi > lo, hi - lo, 1.0)
+    score = ((values - lo) / span).sum(axis=1)
+    order = np.lexsort((*values.T[::-1], score))
+    ranked = values[order]
+    keep = np.zeros(len(values), dtype=bool)
+    front, strength = ranked[:0], np.zeros(0, dtype=np.int64)
+    for start in range(0, len(ranked), PARETO_BLOCK):
+        block = ranked[start:start + PARETO_BLOCK]
+        dominated, hits = _dominated(block, front)
+        strength += hits
+        alive = ~dominated
+        alive[alive] = ~_dominated(block[alive], block[alive])[0]
+        keep[order[start:start + PARETO_BLOCK][alive]] = True
+        front = np.concatenate([front, block[alive]])
+        strength = np.concatenate([strength, np.zeros(alive.sum(), dtype=np.int64)])
+        if hits.any():
+            by_strength = np.argsort(-strength, kind="stable")
+            front, strength = front[by_strength], strength[by_strength]
+    return keep
+
+
+def pareto_front(results, objectives=None):
+    """Boolean Series marking the Pareto-optimal rows of a results_df.
+
+    objectives maps column names to "min" or "max" (default
+    PARETO_OBJECTIVES). Filter with results[pareto_front(results)].
+    """
+    objectives = PARETO_OBJECTIVES if objectives is None else objectives
+    sign = np.array([1.0 if sense == "min" else -1.0 for sense in objectives.values()])
+    values = results[list(objectives)].to_numpy(dtype=float) * sign
+    return pd.Series(pareto_mask(values), index=results.index, name="Pareto optimal")
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# Revenue and Margin Model
+# -----------------------------
+# Feedstock composition is given in grams of metal per ton of e-waste, and
+# prices in $ per gram, so (composition * recovery * price) is $ per ton
+# processed and can be compared directly with "Total cost ($/t)".
+REVENUE_METALS = ["Au", "Pd", "Cu"]
+
+# Indicative prices ($/g): Au ~2,300 $/oz, Pd ~1,000 $/oz, Cu ~9,000 $/t
+DEFAULT_PRICES = {"Au": 74.0, "Pd": 32.0, "Cu": 0.009}
+
+
+def recovery_matrix(results, metals=REVENUE_METALS):
+    """(methods x metals) recovery fractions from a results_df."""
+    return results[[f"{m} recovery" for m in metals]].to_numpy(dtype=float)
+
+
+def recovered_mass(composition, results, metals=REVENUE_METALS):
+    """Recovered grams per ton as a (streams x methods x metals) array."""
+    comp = composition[metals].to_numpy(dtype=float)
+    return comp[:, None, :] * recovery_matrix(results, metals)[None, :, :]
+
+
+def revenue_and_margin(composition, results, prices=None, metals=REVENUE_METALS):
+    """Revenue and margin ($/t) for every feedstock stream and method.
+
+    composition: streams x metals (g/t); results: results_df of the cost
+    engine. Revenue is one (streams x metals) @ (metals x methods) matrix
+    product; margin subtracts each method's total cost.
+    """
+    prices = DEFAULT_PRICES if prices is None else prices
+    price = np.array([prices[m] for m in metals], dtype=float)
+    comp = composition[metals].to_numpy(dtype=float)
+    revenue = (comp * price) @ recovery_matrix(results, metals).T
+    margin = revenue - results["Total cost ($/t)"].to_numpy(dtype=float)
+
+    index = pd.Index(composition.index, name=composition.index.name or "Stream")
+    columns = pd.Index(results.index, name="Method")
+    return (pd.DataFrame(revenue, index=index, columns=columns),
+            pd.DataFrame(margin, index=index, columns=columns))
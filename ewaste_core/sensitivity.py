@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+
+from .bioleaching import METALS, _synergy_v, default_catalog
+from .cost_model import ENERGY_PRICE, PARAM_COLUMNS, cost_components
+from .optimize import O_BOUNDS, PH_BOUNDS, T_BOUNDS
+
+# -----------------------------
+# Variance-Based (Sobol) Sensitivity
+# -----------------------------
+# Saltelli sampling: two independent (n x d) matrices A and B plus d hybrids
+# AB_i (A with column i taken from B). All n * (d + 2) rows are evaluated in
+# one batched model call. First-order indices use the Saltelli (2010)
+# estimator and total-order indices the Jansen (1999) estimator.
+
+
+def saltelli_sample(bounds, n, seed=None):
+    """Stacked [A; B; AB_1; ...; AB_d] rows, uniform within bounds (d x 2)."""
+    bounds = np.asarray(bounds, dtype=float)
+    d = len(bounds)
+    rng = np.random.default_rng(seed)
+    lo, width = bounds[:, 0], bounds[:, 1] - bounds[:, 0]
+    A = lo + rng.random((n, d)) * width
+    B = lo + rng.random((n, d)) * width
+    AB = np.repeat(A[None], d, axis=0)
+    AB[np.arange(d), :, np.arange(d)] = B.T
+    return np.concatenate([A, B, AB.reshape(d * n, d)])
+
+
+def sobol_indices(model, bounds, names, n=8192, seed=None):
+    """First-order (S1) and total (ST) Sobol indices of a batched model.
+
+    model maps an (N x d) array of inputs to N outputs.
+    """
+    d = len(bounds)
+    y = np.asarray(model(saltelli_sample(bounds, n, seed)), dtype=float)
+    # Centering leaves the indices unchanged but cuts estimator variance
+    y = y - y[:2 * n].mean()
+    fA, fB, fAB = y[:n], y[n:2 * n], y[2 * n:].reshape(d, n)
+
+    var = np.var(np.concatenate([fA, fB]))
+    if var == 0:
+        s1 = st = np.zeros(d)
+    else:
+        s1 = np.mean(fB * (fAB - fA), axis=1) / var
+        st = 0.5 * np.mean((fA - fAB) ** 2, axis=1) / var
+    return pd.DataFrame({"S1": s1, "ST": st}, index=pd.Index(names, name="Input"))
+
+
+# -----------------------------
+# Model Adapters
+# -----------------------------
+COST_INPUTS = ["Energy_kWh_per_t", "Chemicals_cost_per_t", "Capex_per_t"]
+
+
+def cost_sensitivity(row, spread=0.2, n=8192, seed=None, energy_price=ENERGY_PRICE):
+    """Sobol indices of total cost for one method row, each input +/- spread."""
+    center = row[COST_INPUTS].to_numpy(dtype=float)
+    bounds = np.stack([center * (1 - spread), center * (1 + spread)], axis=1)
+
+    def model(x):
+        return cost_components(x[:, 0], x[:, 1], x[:, 2], energy_price)[1]
+
+    return sobol_indices(model, bounds, COST_INPUTS, n, seed)
+
+
+BIO_INPUTS = ["pH", "T", "DO", "pH_opt", "pH_sigma", "T_opt", "T_sigma", "K_O", "recovery_max"]
+
+
+def recovery_sensitivity(org, metal=METALS[0], pH_bounds=PH_BOUNDS, T_bounds=T_BOUNDS,
+                         O_bounds=O_BOUNDS, spread=0.2, n=8192, seed=None, catalog=None):
+    """Sobol indices of recovery_fraction for one organism and metal.
+
+    Operating conditions vary over their bounds and the organism's
+    parameters by +/- spread around their catalog values.
+    """
+    c = default_catalog() if catalog is None else catalog
+    i = c.index[org]
+    params = np.array([c.pH_opt[i], c.pH_sigma[i], c.T_opt[i], c.T_sigma[i], c.K_O[i],
+                       c.base(i, c.metal_index.get(metal, -1))])
+    bounds = np.vstack([
+        [pH_bounds, T_bounds, O_bounds],
+        np.stack([params * (1 - spread), params * (1 + spread)], axis=1),
+    ])
+
+    def model(x):
+        synergy = _synergy_v(x[:, 0], x[:, 1], x[:, 2], *x[:, 3:8].T)
+        return np.clip(x[:, 8] * synergy, 0.0, 1.0)
+
+    return sobol_indices(model, bounds, BIO_INPUTS, n, seed)
+
+
+# -----------------------------
+# One-at-a-Time Tornado Sweep
+# -----------------------------
+ENERGY_PRICE_INPUT = "Energy price ($/kWh)"
+TORNADO_INPUTS = PARAM_COLUMNS + [ENERGY_PRICE_INPUT]
+
+
+def tornado(df, pct=0.1, energy_price=ENERGY_PRICE):
+    """Total-cost swing when each input is moved -/+ pct, for every method.
+
+    All (inputs x {low, high}) scenarios for all methods are evaluated as a
+    single (methods x scenarios) array. Returns a frame indexed by
+    (Method, Input) with the low/high total cost and the absolute swing.
+    """
+    names = TORNADO_INPUTS
+    k = len(names)
+    # Scenario factors: rows are scenarios (low for each input, then high)
+    factors = np.ones((2 * k, k))
+    factors[np.arange(k), np.arange(k)] = 1 - pct
+    factors[k + np.arange(k), np.arange(k)] = 1 + pct
+
+    values = np.column_stack([df[col].to_numpy(dtype=float) for col in PARAM_COLUMNS]
+                             + [np.full(len(df), float(energy_price))])
+    x = values[:, None, :] * factors[None, :, :]
+    col = {name: j for j, name in enumerate(names)}
+    total = cost_components(
+        x[..., col["Energy_kWh_per_t"]], x[..., col["Chemicals_cost_per_t"]],
+        x[..., col["Capex_per_t"]], x[..., col[ENERGY_PRICE_INPUT]],
+    )[1]
+    low, high = total[:, :k], total[:, k:]
+
+    index = pd.MultiIndex.from_product([df.index, names], names=["Method", "Input"])
+    return pd.DataFrame({
+        "Low ($/t)": low.ravel(),
+        "High ($/t)": high.ravel(),
+        "Swing ($/t)": np.abs(high - low).ravel(),
+    }, index=index)
@@ -0,0 +1,59 @@
+"""Vectorized recovery against the scalar recovery_fraction.
+
+    python -m unittest discover tests
+"""
+import itertools
+import unittest
+
+import numpy as np
+
+from ewaste_core import METALS, default_catalog, recovery_fraction, recovery_grid, recovery_points
+
+# Slider domain plus points outside it (acidic and alkaline pH, cold and hot
+# tanks, slightly negative DO from a miscalibrated probe)
+PH = np.linspace(-1.0, 6.0, 15)
+T = np.linspace(0.0, 70.0, 15)
+O = np.linspace(-0.5, 15.0, 11)
+
+
+def scalar_grid(orgs, metals, pH, T, O):
+    out = np.empty((len(orgs), len(metals), len(pH), len(T), len(O)))
+    for (a, org), (b, metal) in itertools.product(enumerate(orgs), enumerate(metals)):
+        for (i, x), (j, y), (k, z) in itertools.product(enumerate(pH), enumerate(T), enumerate(O)):
+            out[a, b, i, j, k] = recovery_fraction(org, float(x), float(y), float(z), metal)
+    return out
+
+
+class RecoveryMatchTest(unittest.TestCase):
+    """The batched paths must reproduce recovery_fraction bit for bit.
+
+    This holds because they use np.float_power, which calls libm pow like
+    Python's **; np.power and ndarray ** can differ in the last bit.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.orgs = default_catalog().names
+        cls.expected = scalar_grid(cls.orgs, METALS, PH, T, O)
+
+    def assert_bit_equal(self, actual, expected):
+        self.assertEqual(actual.shape, expected.shape)
+        mismatches = np.count_nonzero(actual.view(np.int64) != expected.view(np.int64))
+        self.assertEqual(mismatches, 0, f"{mismatches} of {expected.size} values differ")
+
+    def test_recovery_grid(self):
+        grid = recovery_grid(self.orgs, METALS, PH[:, None, None], T[None, :, None],
+                             O[None, None, :])
+        self.assert_bit_equal(grid, self.expected)
+
+    def test_recovery_points(self):
+        a, b, i, j, k = np.meshgrid(np.arange(len(self.orgs)), np.arange(len(METALS)),
+                                    np.arange(len(PH)), np.arange(len(T)), np.arange(len(O)),
+                                    indexing="ij")
+        points = recovery_points(np.asarray(self.orgs)[a.ravel()], np.asarray(METALS)[b.ravel()],
+                                 PH[i.ravel()], T[j.ravel()], O[k.ravel()])
+        self.assert_bit_equal(points.reshape(self.expected.shape), self.expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""SweepExecutor against the serial functions.
+
+    python -m unittest discover tests
+"""
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run in a fresh interpreter: resource tracker warnings are printed when the
+# tracker shuts down, after the executor is gone.
+SCRIPT = textwrap.dedent("""
+    import numpy as np
+    import pandas as pd
+
+    from ewaste_core import (METALS, PARAM_COLUMNS, default_catalog, load_parameters,
+                             monte_carlo, recovery_grid, recovery_points)
+    from ewaste_core.parallel import SweepExecutor
+
+    if __name__ == "__main__":
+        df = load_parameters()
+        for c in PARAM_COLUMNS:
+            df[f"{c}_low"], df[f"{c}_high"] = df[c] * 0.8, df[c] * 1.2
+        # More methods than MC_METHOD_BLOCK, so the run spans several blocks
+        many = pd.concat([df] * 12)
+        many.index = [f"{m} #{k}" for k in range(12) for m in df.index]
+        orgs = default_catalog().names
+        pH, T, O = np.linspace(0.5, 4, 12), np.linspace(15, 50, 8), np.linspace(0, 10, 5)
+        rng = np.random.default_rng(0)
+        n = 5000
+        points = (rng.choice(orgs, n), rng.choice(METALS, n), rng.uniform(0.5, 4, n),
+                  rng.uniform(15, 50, n), rng.uniform(0, 10, n))
+
+        with SweepExecutor(2) as ex:
+            mc = ex.monte_carlo(df, 20_000, seed=3, chunk_size=5000)
+            mc_many = ex.monte_carlo(many, 5000, seed=4)
+            grid = ex.recovery_grid(orgs, METALS, pH, T, O)
+            pts = ex.recovery_points(*points)
+            assert "speedup" not in ex.last_report
+
+        with SweepExecutor(2, measure_speedup=True) as timed:
+            timed.monte_carlo(df, 5000, seed=3)
+            report = timed.last_report
+            assert report["serial_s"] > 0
+            assert report["speedup"] == report["serial_s"] / report["wall_s"]
+
+        assert mc.equals(monte_carlo(df, 20_000, seed=3, chunk_size=5000))
+        assert mc_many.equals(monte_carlo(many, 5000, seed=4))
+        assert np.array_equal(grid, recovery_grid(orgs, METALS, pH[:, None, None],
+                                                  T[None, :, None], O[None, None, :]))
+        assert np.array_equal(pts, recovery_points(*points))
+        print("ok")
+""")
+
+
+class SweepExecutorTest(unittest.TestCase):
+    def test_matches_serial_without_warnings(self):
+        proc = subprocess.run([sys.executable, "-c", SCRIPT], cwd=ROOT, capture_output=True,
+                              text=True, timeout=600)
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertEqual(proc.stdout.strip(), "ok")
+        self.assertEqual(proc.stderr, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""pareto_mask against a brute-force O(n^2) reference.
+
+    python -m unittest discover tests
+"""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from ewaste_core import pareto_front, pareto_mask
+from ewaste_core.pareto import PARETO_BLOCK
+
+
+def brute_force_mask(values):
+    values = np.asarray(values, dtype=float)
+    keep = np.ones(len(values), dtype=bool)
+    for i, row in enumerate(values):
+        dominated = (values <= row).all(axis=1) & (values < row).any(axis=1)
+        keep[i] = not dominated.any()
+    return keep
+
+
+class ParetoMaskTest(unittest.TestCase):
+    def assert_matches(self, values):
+        np.testing.assert_array_equal(pareto_mask(values), brute_force_mask(values))
+
+    def test_random_floats(self):
+        rng = np.random.default_rng(0)
+        for n, d in [(2, 2), (50, 3), (700, 5), (2 * PARETO_BLOCK + 17, 4)]:
+            self.assert_matches(rng.random((n, d)))
+
+    def test_tied_integers(self):
+        # Few distinct levels: many equal sums, duplicate rows and ties
+        rng = np.random.default_rng(1)
+        for n, d, levels in [(300, 2, 3), (1500, 3, 5), (2500, 5, 4)]:
+            self.assert_matches(rng.integers(0, levels, (n, d)).astype(float))
+
+    def test_duplicate_rows(self):
+        rows = np.array([[1.0, 2.0], [2.0, 1.0], [1.0, 2.0], [3.0, 3.0], [2.0, 1.0]])
+        self.assert_matches(rows)
+        np.testing.assert_array_equal(pareto_mask(rows), [True, True, True, False, True])
+        np.testing.assert_array_equal(pareto_mask(np.ones((5, 3))), np.ones(5, dtype=bool))
+
+    def test_scaled_objectives(self):
+        # Objectives of very different magnitude round the normalized sums
+        rng = np.random.default_rng(2)
+        levels = np.array([1e-17, 0.1, 0.3, 3.0, 1e17])
+        for _ in range(20):
+            values = rng.choice(levels, (300, 4)) * rng.choice([1.0, 1.0 + 1e-16], (300, 4))
+            self.assert_matches(values)
+
+    def test_rounded_score_tie(self):
+        # A block of rows dominated by the next one, with normalized sums that
+        # round to the same value, so only the tie-break keeps them apart
+        dominated = np.tile([np.nextafter(1.0, 2.0), 0.0], (PARETO_BLOCK, 1))
+        values = np.vstack([dominated, [[1.0, 0.0], [1e17, -1.0]]])
+        expected = np.r_[np.zeros(PARETO_BLOCK, dtype=bool), True, True]
+        np.testing.assert_array_equal(pareto_mask(values), expected)
+
+    def test_empty_and_single(self):
+        self.assertEqual(pareto_mask(np.empty((0, 3))).shape, (0,))
+        np.testing.assert_array_equal(pareto_mask(np.array([[4.0, 2.0, 7.0]])), [True])
+
+    def test_pareto_front_senses(self):
+        results = pd.DataFrame({"cost": [1.0, 2.0, 3.0], "yield": [0.5, 0.9, 0.4]},
+                               index=["a", "b", "c"])
+        front = pareto_front(results, {"cost": "min", "yield": "max"})
+        self.assertEqual(front.to_dict(), {"a": True, "b": True, "c": False})
+
+
+if __name__ == "__main__":
+    unittest.main()